@@ -3,14 +3,30 @@
 IT Jobs Intelligence Dashboard — Flask Application
 Converted from CGI-bin scripts for deployment on DigitalOcean Droplet.
 Run with: gunicorn -w 2 -b 0.0.0.0:8000 app:app
+(gunicorn.conf.py in the working directory adds preload + warm-up hooks)
 """
+import bisect
+import fcntl
+import gzip
+import hashlib
 import json
 import logging
+import mmap
 import os
 import re
 import html
+import select
+import socket
+import shutil
+import struct
+import sys
+import threading
 import time
-from datetime import datetime, timezone, timedelta
+import unicodedata
+import zlib
+from array import array
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 from urllib.request import urlopen, Request
@@ -18,7 +34,7 @@ from urllib.error import URLError
 from xml.etree import ElementTree
 from email.utils import parsedate_to_datetime
 
-from flask import Flask, request, jsonify, send_from_directory, abort
+from flask import Flask, Response, request, jsonify, send_from_directory, abort
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -28,6 +44,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # ─── App Setup ────────────────────────────────────────────────────────────────
+PROCESS_STARTED_AT = time.time()
+
 app = Flask(__name__, static_folder="static", static_url_path="/static")
 
 # Data directory for cache and dashboard_data files
@@ -38,12 +56,24 @@ DATA_DIR.mkdir(exist_ok=True)
 JOBS_CACHE_FILE    = DATA_DIR / "jobs_cache.json"
 NEWS_CACHE_FILE    = DATA_DIR / "news_cache.json"
 DASHBOARD_DATA_FILE = DATA_DIR / "dashboard_data.json"
+JOBS_SNAPSHOT_IMAGE = DATA_DIR / "jobs_snapshot.bin"
+JOBS_CACHE_IMAGE    = DATA_DIR / "jobs_cache.bin"
+ROLLUPS_FILE        = DATA_DIR / "rollups.json"
+CHANGES_FILE        = DATA_DIR / "changes.json"
+STATS_FILE          = DATA_DIR / "stats.json"
+SAVED_SEARCHES_FILE = DATA_DIR / "saved_searches.json"
+SAVED_SEARCH_RESULTS_FILE = DATA_DIR / "saved_search_results.json"
+PAGES_DIR           = DATA_DIR / "pages"
+SNAPSHOT_STAGING_DIR = DATA_DIR / "staging"
 
 CACHE_TTL = 1800   # 30 minutes
-MAX_BODY_SIZE = 1_048_576  # 1 MB
+MAX_BODY_SIZE = 1_048_576  # 1 MB, applied to the decompressed body
 JOBS_SNAPSHOT_MAX_AGE_SECONDS = 6 * 3600  # Hunter snapshot freshness window
 JOBS_SNAPSHOT_MAX_ITEMS = 1000
+JOBS_SNAPSHOT_MAX_BATCHES = 50
+SNAPSHOT_STAGING_TTL = 3600  # drop incomplete batched snapshots after 1h
 JOBS_MAX_AGE_DAYS = int(os.environ.get("JOBS_MAX_AGE_DAYS", "10"))  # hide stale postings
+FORCE_REFRESH_COOLDOWN = int(os.environ.get("FORCE_REFRESH_COOLDOWN", "120"))  # seconds a refresh counts as current
 
 
 def safe_external_url(value) -> str:
@@ -69,12 +99,80 @@ def parse_positive_int(value, default=1, max_value=10_000) -> int:
     return min(parsed, max_value)
 
 
+# ─── File helpers ─────────────────────────────────────────────────────────────
+@contextmanager
+def file_lock(name: str):
+    """Exclusive advisory lock shared by every gunicorn worker."""
+    with open(DATA_DIR / f".{name}.lock", "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def tmp_name(path) -> str:
+    """Tmp sibling unique to this process and thread: workers and their background threads may write the same file."""
+    return f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+
+
+def write_json_atomic(path: Path, data):
+    tmp_file = tmp_name(path)
+    with open(tmp_file, "w") as f:
+        json.dump(data, f, default=str)
+    os.replace(tmp_file, str(path))  # atomic on POSIX
+
+
+def best_effort(fn, label: str):
+    """Run fn() for derived data (rollups, stats, …); a failure is logged, never raised into an ingest."""
+    try:
+        return fn()
+    except Exception as e:
+        logger.warning("%s failed: %s", label, e)
+        return None
+
+
+_json_file_cache = {}  # path -> (stamp, parsed)
+
+
+def read_json_cached(path: Path, default=None):
+    """
+    Parse a JSON file once per version (inode/mtime/size) per process.
+    The returned object is shared between requests — never mutate it.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _json_file_cache.pop(path, None)
+        return default
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _json_file_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, "r") as f:
+            parsed = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return default
+    _json_file_cache[path] = (stamp, parsed)
+    return parsed
+
+
 # ─── CORS helper ──────────────────────────────────────────────────────────────
 def cors_response(data, status=200):
     resp = jsonify(data)
     resp.status_code = status
     resp.headers["Access-Control-Allow-Origin"] = "*"
-    resp.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
+    resp.headers["Access-Control-Allow-Methods"] = "GET, POST, DELETE, OPTIONS"
+    resp.headers["Access-Control-Allow-Headers"] = "Authorization, Content-Type"
+    return resp
+
+
+def cors_raw_response(body: bytes, status=200, content_type="application/json"):
+    """Like cors_response, for bodies that are already serialized."""
+    resp = Response(body, status=status, content_type=content_type)
+    resp.headers["Access-Control-Allow-Origin"] = "*"
+    resp.headers["Access-Control-Allow-Methods"] = "GET, POST, DELETE, OPTIONS"
     resp.headers["Access-Control-Allow-Headers"] = "Authorization, Content-Type"
     return resp
 
@@ -234,6 +332,312 @@ def normalize_ingested_job(job: dict) -> dict:
     }
 
 
+# ── Salary parsing ─────────────────────────────────────────────────────────────
+# Free-form salary strings ("$120k - $150k", "€60,000", "$50/hr") become an
+# annualized min/max in the posting's own currency plus the stated period.
+# Amounts are not FX-converted; filters can narrow by currency instead.
+
+SALARY_CURRENCY_SYMBOLS = [("us$", "USD"), ("ca$", "CAD"), ("c$", "CAD"), ("au$", "AUD"), ("a$", "AUD"),
+                           ("$", "USD"), ("€", "EUR"), ("£", "GBP"), ("₹", "INR")]
+_SALARY_CURRENCY_CODE_RE = re.compile(r"\b(usd|eur|gbp|cad|aud|inr|chf)\b")
+SALARY_PERIODS = [
+    ("hour",  re.compile(r"/\s*(h|hr|hour)\b|\bper hour\b|\bhourly\b|\ban hour\b")),
+    ("day",   re.compile(r"/\s*day\b|\bper day\b|\bdaily\b|\ba day\b")),
+    ("week",  re.compile(r"/\s*(wk|week)\b|\bper week\b|\bweekly\b|\ba week\b")),
+    ("month", re.compile(r"/\s*(mo|month)\b|\bper month\b|\bmonthly\b|\ba month\b")),
+    ("year",  re.compile(r"/\s*(yr|year|annum)\b|\bper (year|annum)\b|\bannual(ly)?\b|\byearly\b|\ba year\b|\bp\.?a\b")),
+]
+SALARY_PERIOD_FACTORS = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+SALARY_ANNUAL_BOUNDS = (1_000, 5_000_000)
+SALARY_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+# Salary filters and sort=salary compare amounts within one currency; this one
+# applies when the request doesn't name it with currency=.
+SALARY_DEFAULT_CURRENCY = os.environ.get("SALARY_DEFAULT_CURRENCY", "USD").strip().upper()
+_SALARY_NUMBER_RE = re.compile(r"(\d[\d.,'’]*)\s*([km])?(?![a-z])")
+_SALARY_RANGE_RE = re.compile(r"\d\s*[km]?\s*(?:-|–|—|to)\s*\D{0,4}\d")
+_SALARY_NOISE_RE = re.compile(r"\b401\(?k\)?")
+
+
+def _salary_number(digits: str, suffix: str):
+    digits = re.sub(r"['’]", "", digits)  # Swiss grouping: 120'000
+    cents = re.fullmatch(r"(\d{1,3}(?:[.,]\d{2,3})*[.,]\d{3})[.,]\d{1,2}", digits)
+    if cents:
+        digits = cents.group(1)  # 120,000.00 / 45.000,00
+    if re.fullmatch(r"\d{1,3}(?:[.,]\d{2,3})*[.,]\d{3}", digits):
+        value = float(re.sub(r"[.,]", "", digits))  # 120,000 / 120.000 / 12,00,000
+    else:
+        try:
+            value = float(digits.replace(",", "."))
+        except ValueError:
+            return None
+    return value * SALARY_SUFFIXES.get(suffix or "", 1)
+
+
+def parse_salary(text: str):
+    """Return {"min", "max", "currency", "period"} with annual amounts, or None."""
+    if not text:
+        return None
+    raw = _SALARY_NOISE_RE.sub(" ", f" {text.lower()} ")
+    numbers = []
+    for m in _SALARY_NUMBER_RE.finditer(raw):
+        digits = m.group(1).rstrip(".,'’")
+        value = _salary_number(digits, m.group(2))
+        if value:
+            numbers.append((value, m.group(2)))
+        if len(numbers) == 2:
+            break
+    if not numbers:
+        return None
+    low, high = numbers[0][0], numbers[-1][0]
+    # "120-150k": the upper bound's suffix applies to the lower one too.
+    if len(numbers) == 2 and numbers[1][1] and not numbers[0][1] and low < 1000:
+        low *= SALARY_SUFFIXES[numbers[1][1]]
+    if high < low:
+        low, high = high, low
+
+    code = _SALARY_CURRENCY_CODE_RE.search(raw)
+    currency = code.group(1).upper() if code else next((c for sym, c in SALARY_CURRENCY_SYMBOLS if sym in raw), "")
+    period = next((name for name, pattern in SALARY_PERIODS if pattern.search(raw)), "")
+    suffixed = any(suffix for _, suffix in numbers)
+    # A bare number ("2 years experience", "1,000 sign-on bonus") is not a salary.
+    if not (currency or suffixed or period or _SALARY_RANGE_RE.search(raw)):
+        return None
+    if not period:
+        if high >= 1000:
+            period = "year"
+        elif currency:
+            period = "hour"  # "$50"
+        else:
+            return None
+    factor = SALARY_PERIOD_FACTORS[period]
+    low, high = int(round(low * factor)), int(round(high * factor))
+    if not (SALARY_ANNUAL_BOUNDS[0] <= low and high <= SALARY_ANNUAL_BOUNDS[1]):
+        return None
+    return {"min": low, "max": high, "currency": currency, "period": period}
+
+
+# ── Location canonicalization ─────────────────────────────────────────────────
+# Free-form locations ("Remote - US", "Berlin, Germany", "Austin, TX") become
+# country codes, a region and a remote scope using the bundled offline
+# gazetteer.json. Phrases match whole tokens, so "US" never hits "Australia".
+
+GAZETTEER_FILE = BASE_DIR / "gazetteer.json"
+LOCATION_MAX_NGRAM = 4
+REMOTE_SCOPES = ("global", "region", "country", "unspecified", "hybrid", "onsite", "unknown")
+REMOTE_ANY = ("global", "region", "country", "unspecified")
+_LOCATION_CODE_RE = re.compile(r",\s*([A-Z]{2})\b")
+
+
+def location_tokens(text: str) -> list:
+    """Lowercase, accent- and dot-free word tokens ("U.S.A." -> "usa", "München" -> "munchen")."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return re.findall(r"[a-z0-9]+", text.lower().replace(".", ""))
+
+
+def load_gazetteer(path: Path = GAZETTEER_FILE) -> dict:
+    """Phrase lookup tables built once from the gazetteer file."""
+    try:
+        raw = json.loads(Path(path).read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Gazetteer unavailable (%s); locations stay uncanonicalized", e)
+        raw = {}
+    places  = {}  # job-location phrase -> ("country" | "city", code) | ("region", name) | ("term", kind)
+    queries = {}  # filter phrase -> same, without cities / subdivisions
+    codes   = {}  # trailing ", XX" code -> country code (subdivisions before countries)
+    countries = {}
+    for name, aliases in (raw.get("regions") or {}).items():
+        for phrase in [name.lower()] + aliases:
+            places[phrase] = queries[phrase] = ("region", name)
+    for kind, terms in (raw.get("remote_terms") or {}).items():
+        for phrase in terms:
+            places[phrase] = queries[phrase] = ("term", kind)
+    subdivision_codes = {}
+    for c in raw.get("countries") or []:
+        code = c["code"]
+        countries[code] = {"name": c["name"], "region": c["region"]}
+        for phrase in [c["name"].lower()] + c.get("aliases", []):
+            places[phrase] = queries[phrase] = ("country", code)
+        for phrase in c.get("cities", []) + list(c.get("subdivisions", {}).values()):
+            places.setdefault(phrase, ("city", code))
+        for sub in c.get("subdivisions", {}):
+            subdivision_codes.setdefault(sub, code)
+    # location=CA / IN / DE could be a US state as well as a country: leave
+    # those to the raw-token match instead of guessing the country.
+    us_states = {sub for sub, code in subdivision_codes.items() if code == "US"}
+    for code in countries:
+        if code not in us_states:
+            queries.setdefault(code.lower(), ("country", code))
+    codes.update({code: code for code in countries})
+    codes.update(subdivision_codes)
+    unknown = {" ".join(location_tokens(t)) for t in raw.get("unknown_terms") or []}
+    return {"places": places, "queries": queries, "codes": codes, "countries": countries, "unknown": unknown}
+
+
+GAZETTEER = load_gazetteer()
+
+
+def _match_phrases(tokens: list, table: dict) -> list:
+    """Longest-first whole-token phrase matches, left to right."""
+    hits, i = [], 0
+    while i < len(tokens):
+        for n in range(min(LOCATION_MAX_NGRAM, len(tokens) - i), 0, -1):
+            hit = table.get(" ".join(tokens[i:i + n]))
+            if hit:
+                hits.append(hit)
+                i += n
+                break
+        else:
+            i += 1
+    return hits
+
+
+def canonical_location(location: str, job_type: str = "") -> dict:
+    """Return {"countries", "region", "remote_scope"} for a raw posting location."""
+    tokens = location_tokens(location)
+    hits = _match_phrases(tokens, GAZETTEER["places"])
+    named = [v for kind, v in hits if kind == "country"]
+    cities = [v for kind, v in hits if kind == "city"]
+    trailing = [c for c in _LOCATION_CODE_RE.findall(location) if c in GAZETTEER["codes"]]
+    # Country names win; a trailing ", TX" beats a city name from elsewhere
+    # ("Paris, TX"), unless it is that city's own country code ("Berlin, DE").
+    if named:
+        codes = list(dict.fromkeys(named))
+    elif trailing and not any(c in cities for c in trailing):
+        codes = list(dict.fromkeys(GAZETTEER["codes"][c] for c in trailing))
+    else:
+        codes = list(dict.fromkeys(cities))
+    terms = {v for kind, v in hits if kind == "term"}
+    regions = {GAZETTEER["countries"][c]["region"] for c in codes}
+    regions.update(v for kind, v in hits if kind == "region")
+    region = next(iter(regions)) if len(regions) == 1 else ""
+
+    if "hybrid" in terms:
+        scope = "hybrid"
+    elif "global" in terms:
+        scope = "global"
+    elif "remote" in terms or "remote" in job_type.lower():
+        scope = "country" if len(codes) == 1 else "region" if regions else "unspecified"
+    elif not tokens or " ".join(tokens) in GAZETTEER["unknown"]:
+        scope = "unknown"  # "", "Unknown", "N/A"
+    else:
+        scope = "onsite"
+    return {"countries": codes, "region": region, "remote_scope": scope}
+
+
+def resolve_location_query(text: str, country_codes: bool = False):
+    """
+    Map a location filter to facet constraints: {"country": code},
+    {"region": name} or {"remote": scopes}. None when the text names no
+    country, region or remote term (callers fall back to a token match).
+    country_codes also accepts ISO codes that double as US state codes,
+    for country= where a code can only mean the country.
+    """
+    if country_codes and text.strip().upper() in GAZETTEER["countries"]:
+        return {"country": text.strip().upper()}
+    hit = GAZETTEER["queries"].get(" ".join(location_tokens(text)))
+    if hit is None:
+        return None
+    kind, value = hit
+    if kind == "term":
+        return {"remote": ("global",) if value == "global" else ("hybrid",) if value == "hybrid" else REMOTE_ANY}
+    return {kind: value}
+
+
+def location_constraints(location: str) -> dict:
+    """LocationIndex.select() kwargs for a location= filter ({} = no filter)."""
+    if not location or location.lower() == "all":
+        return {}
+    return resolve_location_query(location) or {"phrase": location}
+
+
+def job_id(url: str) -> str:
+    """Stable short id for a posting, derived from its URL."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+
+
+_shared_ints = {}  # salary amounts repeat a lot; share them like interned strings
+_shared_countries = {}  # likewise the handful of distinct country-code tuples
+
+
+class JobRecord:
+    """
+    Compact in-memory job used by the read path.
+    Categorical strings are interned so the thousands of "Remote" /
+    "Full-time" / source / tag values share one object each; a dict is only
+    built for jobs that actually go out in a response.
+    """
+    __slots__ = ("id", "title", "company", "location", "salary", "type",
+                 "posted", "url", "source", "snippet", "tags",
+                 "salary_min", "salary_max", "salary_currency", "salary_period",
+                 "countries", "region", "remote_scope", "posted_ts", "relevant")
+
+    def __init__(self, title="", company="", location="", salary="", type="",
+                 posted="", url="", source="", snippet="", tags=()):
+        intern = sys.intern
+        self.id       = job_id(url)
+        self.title    = title
+        self.company  = intern(company)
+        self.location = intern(location)
+        self.salary   = intern(salary)
+        self.type     = intern(type)
+        self.posted   = posted
+        self.url      = url
+        self.source   = intern(source)
+        self.snippet  = snippet
+        self.tags     = tuple(intern(t) for t in tags)
+        parsed = parse_salary(salary)
+        self.salary_min      = _shared_ints.setdefault(parsed["min"], parsed["min"]) if parsed else None
+        self.salary_max      = _shared_ints.setdefault(parsed["max"], parsed["max"]) if parsed else None
+        self.salary_currency = intern(parsed["currency"]) if parsed else ""
+        self.salary_period   = intern(parsed["period"]) if parsed else ""
+        place = canonical_location(location, type)
+        countries = tuple(intern(c) for c in place["countries"])
+        self.countries    = _shared_countries.setdefault(countries, countries)
+        self.region       = intern(place["region"])
+        self.remote_scope = intern(place["remote_scope"])
+        dt = parse_posted_datetime(posted)
+        self.posted_ts = dt.timestamp() if dt else None
+        self.relevant  = role_text_is_relevant(title, self.tags)
+
+    @classmethod
+    def from_dict(cls, job: dict) -> "JobRecord":
+        tags = job.get("tags", [])
+        return cls(
+            title=str(job.get("title") or ""),
+            company=str(job.get("company") or ""),
+            location=str(job.get("location") or ""),
+            salary=str(job.get("salary") or ""),
+            type=str(job.get("type") or ""),
+            posted=str(job.get("posted") or ""),
+            url=str(job.get("url") or ""),
+            source=str(job.get("source") or ""),
+            snippet=str(job.get("snippet") or ""),
+            tags=[str(t) for t in tags] if isinstance(tags, list) else [],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id":       self.id,
+            "title":    self.title,
+            "company":  self.company,
+            "location": self.location,
+            "salary":   self.salary,
+            "type":     self.type,
+            "posted":   self.posted,
+            "url":      self.url,
+            "tags":     list(self.tags),
+            "source":   self.source,
+            "snippet":  self.snippet,
+            "salary_min":      self.salary_min,
+            "salary_max":      self.salary_max,
+            "salary_currency": self.salary_currency,
+            "salary_period":   self.salary_period,
+            "countries":       list(self.countries),
+            "region":          self.region,
+            "remote_scope":    self.remote_scope,
+        }
+
+
 def parse_posted_datetime(value):
     """Parse job posted timestamp from common formats."""
     if value is None:
@@ -272,16 +676,14 @@ def parse_posted_datetime(value):
         return None
 
 
-def is_recent_job(job: dict, max_age_days: int = JOBS_MAX_AGE_DAYS) -> bool:
-    dt = parse_posted_datetime(job.get("posted") or job.get("posted_at"))
-    if dt is None:
+def is_recent_job(job: JobRecord, max_age_days: int = JOBS_MAX_AGE_DAYS) -> bool:
+    if job.posted_ts is None:
         # Keep unknown timestamps; source filters already narrow role quality.
         return True
-    now = datetime.now(timezone.utc)
-    age = now - dt
-    if age < timedelta(days=-2):
+    age = time.time() - job.posted_ts
+    if age < -2 * 86400:
         return False
-    return age <= timedelta(days=max_age_days)
+    return age <= max_age_days * 86400
 
 
 # ── Role relevance filter ─────────────────────────────────────────────────────
@@ -315,11 +717,15 @@ EXCLUDE_ROLE_KEYWORDS = [
     "bookkeeper", "payroll", "billing specialist",
 ]
 
-def is_relevant_role(job):
-    """Check if a job is an IT/engineering role."""
-    title = job.get("title", "").lower()
-    tags  = " ".join(job.get("tags", [])).lower()
-    text  = f"{title} {tags}"
+def is_relevant_role(job: JobRecord) -> bool:
+    """Check if a job is an IT/engineering role (decided once per job, at build time)."""
+    return job.relevant
+
+
+def role_text_is_relevant(title: str, tags) -> bool:
+    """Keyword test behind is_relevant_role(), on a job's title and tags."""
+    title = title.lower()
+    text  = f"{title} {' '.join(tags).lower()}"
 
     # Exclude obvious non-tech roles
     for kw in EXCLUDE_ROLE_KEYWORDS:
@@ -336,35 +742,1002 @@ def is_relevant_role(job):
                  "kubernetes", "sql", "typescript", "java", "golang", "rust",
                  "devops", "machine-learning", "data", "ai", "ml", "cloud",
                  "backend", "frontend", "full-stack", "engineering"}
-    job_tags_lower = {t.lower() for t in job.get("tags", [])}
+    job_tags_lower = {t.lower() for t in tags}
     if job_tags_lower & tech_tags:
         return True
 
     return False
 
 
-def filter_jobs(jobs, query="", location="", job_type=""):
-    # Always apply role relevance filter first
-    relevant = [j for j in jobs if is_relevant_role(j)]
+# ── Columnar wire format (format=columnar) ────────────────────────────────────
+# Parallel arrays per field; categorical values are indexes into a per-response
+# string table. Snippets are left out and fetched lazily from /api/job.py.
+JOB_COLUMNAR_FIELDS      = ("id", "title", "company", "location", "salary",
+                            "type", "posted", "url", "source", "tags",
+                            "salary_min", "salary_max", "salary_currency", "salary_period",
+                            "countries", "region", "remote_scope")
+JOB_COLUMNAR_CATEGORICAL = ("company", "location", "salary", "type", "source", "tags",
+                            "salary_currency", "salary_period", "countries", "region", "remote_scope")
+
+
+def encode_columnar(jobs: list) -> dict:
+    strings    = []
+    string_ids = {}
+
+    def sid(value: str) -> int:
+        idx = string_ids.get(value)
+        if idx is None:
+            idx = string_ids[value] = len(strings)
+            strings.append(value)
+        return idx
+
+    columns = {}
+    for field in JOB_COLUMNAR_FIELDS:
+        if field in ("tags", "countries"):
+            columns[field] = [[sid(v) for v in getattr(j, field)] for j in jobs]
+        elif field in JOB_COLUMNAR_CATEGORICAL:
+            columns[field] = [sid(getattr(j, field)) for j in jobs]
+        else:
+            columns[field] = [getattr(j, field) for j in jobs]
+    return {
+        "format":      "columnar",
+        "fields":      list(JOB_COLUMNAR_FIELDS),
+        "categorical": list(JOB_COLUMNAR_CATEGORICAL),
+        "strings":     strings,
+        "columns":     columns,
+    }
+
+
+def search_text(j: JobRecord) -> str:
+    """What query= is matched against (substring, case-insensitive)."""
+    return f"{j.title} {j.company} {' '.join(j.tags)} {j.snippet}".lower()
 
-    if not query and not location and not job_type:
+
+def matches_job_type(j: JobRecord, job_type: str) -> bool:
+    if job_type == "remote":
+        return "remote" in j.type.lower() or "remote" in j.location.lower()
+    return True
+
+
+def filter_jobs(records, positions, query="", job_type=""):
+    """Positions (in order) of relevant jobs matching query= and type=."""
+    # Always apply role relevance filter first; location is resolved through
+    # LocationIndex before this runs.
+    relevant = [p for p in positions if is_relevant_role(records[p])]
+
+    if not query and not job_type:
         return relevant
     filtered = []
     q   = query.lower()
-    loc = location.lower()
-    for j in relevant:
-        text = f"{j['title']} {j['company']} {' '.join(j['tags'])} {j['snippet']}".lower()
-        if q and q not in text:
+    for p in relevant:
+        j = records[p]
+        if q and q not in search_text(j):
             continue
-        if loc and loc != "all" and loc not in j.get("location", "").lower() and loc not in text:
+        if not matches_job_type(j, job_type):
             continue
-        if job_type and job_type != "all":
-            if job_type == "remote" and "remote" not in j.get("type", "").lower() and "remote" not in j.get("location", "").lower():
-                continue
-        filtered.append(j)
+        filtered.append(p)
     return filtered
 
 
+# ── Salary index ───────────────────────────────────────────────────────────────
+class SalaryIndex:
+    """
+    Positions of a record list sorted by annual salary, per currency, so
+    salary_min / salary_max filters are two bisects instead of a scan.
+    Amounts are never compared across currencies. Built once per record
+    list; records without a parsed salary or currency are absent.
+    """
+
+    def __init__(self, records: list):
+        groups = {}
+        for pos, j in enumerate(records):
+            if j.salary_max is None:
+                continue
+            if j.salary_currency:
+                groups.setdefault(j.salary_currency, []).append((j.salary_min, j.salary_max, pos))
+        self._lo = {}
+        self._hi = {}
+        for key, entries in groups.items():
+            by_lo = sorted((lo, pos) for lo, _, pos in entries)
+            by_hi = sorted((hi, pos) for _, hi, pos in entries)
+            self._lo[key] = ([v for v, _ in by_lo], [p for _, p in by_lo])
+            self._hi[key] = ([v for v, _ in by_hi], [p for _, p in by_hi])
+
+    def by_salary_desc(self, currency: str) -> list:
+        """Positions in this currency, highest annual max first."""
+        return self._hi.get(currency, ([], []))[1][::-1]
+
+    def select(self, salary_min=0, salary_max=0, currency=SALARY_DEFAULT_CURRENCY) -> set:
+        """Positions in currency whose range reaches salary_min and starts at or below salary_max."""
+        hi_values, hi_pos = self._hi.get(currency, ([], []))
+        lo_values, lo_pos = self._lo.get(currency, ([], []))
+        selected = set(hi_pos[bisect.bisect_left(hi_values, salary_min):] if salary_min else hi_pos)
+        if salary_max:
+            selected &= set(lo_pos[:bisect.bisect_right(lo_values, salary_max)])
+        return selected
+
+
+_salary_indexes = {}  # id(records) -> (records, SalaryIndex)
+
+
+def _index_for(cache: dict, build, records: list):
+    """Index for this exact record list, built once per list (i.e. per image version)."""
+    cached = cache.get(id(records))
+    if cached and cached[0] is records:
+        return cached[1]
+    index = build(records)
+    if len(cache) >= 4:
+        cache.clear()  # only the current snapshot/cache lists matter
+    cache[id(records)] = (records, index)
+    return index
+
+
+def salary_index(records: list) -> SalaryIndex:
+    return _index_for(_salary_indexes, SalaryIndex, records)
+
+
+SALARY_HISTOGRAM_EDGES = (0, 50_000, 75_000, 100_000, 125_000, 150_000, 175_000, 200_000, 250_000)
+
+
+def salary_histogram(records) -> dict:
+    """
+    Counts of shown jobs per annual-midpoint bucket. The edges are in
+    SALARY_DEFAULT_CURRENCY units and nothing is converted, so only that
+    currency is bucketed; other currencies are just counted.
+    """
+    counts = [0] * len(SALARY_HISTOGRAM_EDGES)
+    other_currencies = {}
+    unparsed = 0
+    for j in records:
+        if not is_relevant_role(j) or not is_recent_job(j):
+            continue
+        if j.salary_max is None:
+            unparsed += 1
+        elif j.salary_currency != SALARY_DEFAULT_CURRENCY:
+            currency = j.salary_currency or "unknown"
+            other_currencies[currency] = other_currencies.get(currency, 0) + 1
+        else:
+            midpoint = (j.salary_min + j.salary_max) // 2
+            counts[bisect.bisect_right(SALARY_HISTOGRAM_EDGES, midpoint) - 1] += 1
+    return {
+        "currency":         SALARY_DEFAULT_CURRENCY,
+        "edges":            list(SALARY_HISTOGRAM_EDGES),
+        "counts":           counts,
+        "other_currencies": other_currencies,
+        "unparsed":         unparsed,
+    }
+
+
+# ── Location index ─────────────────────────────────────────────────────────────
+class LocationIndex:
+    """
+    Posting lists (record positions) per canonical country, region and remote
+    scope, plus per raw-location token for places the gazetteer doesn't know.
+    Location filters become set lookups instead of a substring scan.
+    """
+
+    def __init__(self, records: list):
+        self.postings = {"country": {}, "region": {}, "remote": {}}
+        self.tokens = {}
+        self.remote_text = set()  # "remote" in type or location, for remote_count
+        self._records = records
+        for pos, j in enumerate(records):
+            for code in j.countries:
+                self.postings["country"].setdefault(code, set()).add(pos)
+            if j.region:
+                self.postings["region"].setdefault(j.region, set()).add(pos)
+            self.postings["remote"].setdefault(j.remote_scope, set()).add(pos)
+            for token in set(location_tokens(j.location)):
+                self.tokens.setdefault(token, []).append(pos)
+            if matches_job_type(j, "remote"):
+                self.remote_text.add(pos)
+
+    def facet_counts(self, positions: set) -> dict:
+        """location_facets for a listing: posting lists intersected with its positions."""
+        every = len(positions) == len(self._records)
+        facets = {}
+        for facet, name in (("country", "countries"), ("region", "regions"), ("remote", "remote")):
+            counts = {value: len(posting) if every else len(posting & positions)
+                      for value, posting in self.postings[facet].items()}
+            facets[name] = {value: n for value, n in counts.items() if n}
+        unknown = len(positions) - sum(facets["regions"].values())  # one region per job at most
+        if unknown:
+            facets["regions"]["Unknown"] = unknown
+        return {name: dict(sorted(counts.items(), key=lambda x: -x[1])) for name, counts in facets.items()}
+
+    def select(self, country="", region="", remote=(), phrase="") -> set:
+        """Positions matching every given constraint; an empty call matches nothing."""
+        selected = None
+        for facet, values in (("country", [country] if country else []),
+                              ("region", [region] if region else []),
+                              ("remote", remote)):
+            if not values:
+                continue
+            matched = set()
+            for value in values:
+                matched.update(self.postings[facet].get(value, ()))
+            selected = matched if selected is None else selected & matched
+        if phrase:
+            words = location_tokens(phrase)
+            matched = set.intersection(*(set(self.tokens.get(w, ())) for w in words)) if words else set()
+            if len(words) > 1:
+                # Candidates share every token; keep those with the words in order.
+                needle = f" {' '.join(words)} "
+                matched = {p for p in matched
+                           if needle in f" {' '.join(location_tokens(self._records[p].location))} "}
+            selected = matched if selected is None else selected & matched
+        return selected or set()
+
+
+_location_indexes = {}  # id(records) -> (records, LocationIndex)
+
+
+def location_index(records: list) -> LocationIndex:
+    return _index_for(_location_indexes, LocationIndex, records)
+
+
+# ── Source index ───────────────────────────────────────────────────────────────
+class SourceIndex:
+    """
+    Positions per source, keyed case-insensitively by full name
+    ("greenhouse:stripe") and by family ("greenhouse"), so source=Greenhouse
+    covers every Hunter board and source=Greenhouse:stripe just that one.
+    """
+
+    def __init__(self, records: list):
+        self.postings = {}
+        self.names = {}  # source as shown in source_counts -> positions
+        for pos, j in enumerate(records):
+            self.names.setdefault(j.source or "Unknown", set()).add(pos)
+            key = (j.source or "Unknown").lower()
+            family = key.split(":", 1)[0]
+            for name in {key, family}:
+                self.postings.setdefault(name, []).append(pos)
+
+    def select(self, sources) -> set:
+        """Positions whose source matches any of the given names or families."""
+        selected = set()
+        for name in sources:
+            selected.update(self.postings.get(name.strip().lower(), ()))
+        return selected
+
+
+_source_indexes = {}  # id(records) -> (records, SourceIndex)
+
+
+def source_index(records: list) -> SourceIndex:
+    return _index_for(_source_indexes, SourceIndex, records)
+
+
+class TagIndex:
+    """Positions per tag, so a listing's top tags are set intersections."""
+
+    def __init__(self, records: list):
+        self.postings = {}
+        for pos, j in enumerate(records):
+            for t in j.tags:
+                self.postings.setdefault(t, set()).add(pos)
+
+
+_tag_indexes = {}  # id(records) -> (records, TagIndex)
+
+
+def tag_index(records: list) -> TagIndex:
+    return _index_for(_tag_indexes, TagIndex, records)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SHARED JOBS IMAGE  (memory-mapped, shared by all gunicorn workers)
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# dashboard_data.json and jobs_cache.json stay the source of truth; the .bin
+# images are derived from them once at write time so workers don't each parse
+# and re-normalize the same jobs. Workers mmap the image read-only and share
+# its pages through the OS page cache.
+#
+# Layout (native-endian uint32 throughout):
+#   header        magic, version, job_count, string_count, tag_ref_count, meta_len
+#   meta          UTF-8 JSON, NUL-padded to a 4-byte boundary
+#   string index  string_count + 1 offsets into the string blob
+#   job records   job_count * (len(JOB_IMAGE_FIELDS) + 2): one string id per
+#                 field, then tag_start / tag_count into the tag refs
+#   tag refs      tag_ref_count string ids
+#   salaries      job_count * 4: annual min, annual max (0 = unparsed),
+#                 currency string id, period string id — parsed at write time
+#   locations     job_count * 3: comma-joined country codes, region, remote
+#                 scope (string ids) — canonicalized at write time
+#   flags         job_count * 2: posted epoch seconds (0 = unknown), role
+#                 relevance (0/1) — decided at write time
+#   ids           job_count string ids: job_id(url) of each job
+#   id order      job_count job positions sorted by id, for binary-search lookup
+#   string blob   UTF-8 bytes of every distinct string, stored once
+
+JOB_IMAGE_MAGIC   = b"ITDJOBS\x00"
+JOB_IMAGE_VERSION = 6
+JOB_IMAGE_FIELDS  = ("title", "company", "location", "salary", "type",
+                     "posted", "url", "source", "snippet")
+_JOB_IMAGE_HEADER = struct.Struct("<8s5I")
+
+
+def write_jobs_image(path: Path, jobs: list, meta: dict):
+    """Serialize jobs into the compact image format and swap it in atomically."""
+    string_ids = {}
+    offsets = array("I", [0])
+    blob = bytearray()
+
+    def sid(value) -> int:
+        value = "" if value is None else str(value)
+        idx = string_ids.get(value)
+        if idx is None:
+            idx = string_ids[value] = len(offsets) - 1
+            blob.extend(value.encode("utf-8"))
+            offsets.append(len(blob))
+        return idx
+
+    def blob_string(idx) -> str:
+        return blob[offsets[idx]:offsets[idx + 1]].decode("utf-8")
+
+    records  = array("I")
+    tag_refs = array("I")
+    salaries = array("I")
+    locations = array("I")
+    flags = array("I")
+    ids = array("I")
+    for job in jobs:
+        ids.append(sid(job_id(str(job.get("url") or ""))))
+        for field in JOB_IMAGE_FIELDS:
+            records.append(sid(job.get(field)))
+        tags = job.get("tags") or []
+        records.append(len(tag_refs))
+        records.append(len(tags))
+        for tag in tags:
+            tag_refs.append(sid(tag))
+        parsed = parse_salary(str(job.get("salary") or ""))
+        if parsed:
+            salaries.extend((parsed["min"], parsed["max"], sid(parsed["currency"]), sid(parsed["period"])))
+        else:
+            salaries.extend((0, 0, sid(""), sid("")))
+        place = canonical_location(str(job.get("location") or ""), str(job.get("type") or ""))
+        locations.extend((sid(",".join(place["countries"])), sid(place["region"]), sid(place["remote_scope"])))
+        posted = parse_posted_datetime(job.get("posted"))
+        flags.append(min(max(int(posted.timestamp()), 1), 0xFFFFFFFF) if posted else 0)
+        flags.append(int(role_text_is_relevant(str(job.get("title") or ""), [str(t) for t in tags])))
+    id_order = array("I", sorted(range(len(jobs)), key=lambda i: blob_string(ids[i])))
+
+    meta_bytes = json.dumps(meta, default=str).encode("utf-8")
+    meta_bytes += b"\x00" * (-len(meta_bytes) % 4)
+    header = _JOB_IMAGE_HEADER.pack(
+        JOB_IMAGE_MAGIC, JOB_IMAGE_VERSION, len(jobs),
+        len(offsets) - 1, len(tag_refs), len(meta_bytes),
+    )
+
+    # Two workers (or two threads of one) may materialize the same image at once.
+    tmp_file = tmp_name(path)
+    with open(tmp_file, "wb") as f:
+        f.write(header)
+        f.write(meta_bytes)
+        f.write(offsets.tobytes())
+        f.write(records.tobytes())
+        f.write(tag_refs.tobytes())
+        f.write(salaries.tobytes())
+        f.write(locations.tobytes())
+        f.write(flags.tobytes())
+        f.write(ids.tobytes())
+        f.write(id_order.tobytes())
+        f.write(blob)
+    os.replace(tmp_file, str(path))  # atomic on POSIX; readers re-map on next access
+
+
+class JobsImage:
+    """Read-only view over a memory-mapped jobs image."""
+
+    # Fields with a handful of distinct values; decoded once per process
+    # instead of on every access.
+    _SHARED_FIELDS = ("type", "source")
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        magic, version, job_count, string_count, tag_ref_count, meta_len = \
+            _JOB_IMAGE_HEADER.unpack_from(self._mm, 0)
+        if magic != JOB_IMAGE_MAGIC or version != JOB_IMAGE_VERSION:
+            raise ValueError(f"unsupported jobs image {path}")
+
+        pos = _JOB_IMAGE_HEADER.size
+        self.meta = json.loads(self._mm[pos:pos + meta_len].rstrip(b"\x00") or b"{}")
+        pos += meta_len
+
+        view = memoryview(self._mm)
+        self._stride = len(JOB_IMAGE_FIELDS) + 2
+        sections = {}
+        for name, count in (("offsets", string_count + 1),
+                            ("records", job_count * self._stride),
+                            ("tag_refs", tag_ref_count),
+                            ("salaries", job_count * 4),
+                            ("locations", job_count * 3),
+                            ("flags", job_count * 2),
+                            ("ids", job_count),
+                            ("id_order", job_count)):
+            sections[name] = view[pos:pos + 4 * count].cast("I")
+            pos += 4 * count
+        self._offsets  = sections["offsets"]
+        self._records  = sections["records"]
+        self._tag_refs = sections["tag_refs"]
+        self._salaries = sections["salaries"]
+        self._locations = sections["locations"]
+        self._flags    = sections["flags"]
+        self._ids      = sections["ids"]
+        self._id_order = sections["id_order"]
+        self._blob     = view[pos:]
+        self._count    = job_count
+        self._shared   = {}  # string id -> str for low-cardinality values
+        self._job_records = None
+
+    def __len__(self):
+        return self._count
+
+    def string(self, idx: int) -> str:
+        return str(self._blob[self._offsets[idx]:self._offsets[idx + 1]], "utf-8")
+
+    def shared_string(self, idx: int) -> str:
+        value = self._shared.get(idx)
+        if value is None:
+            value = self._shared[idx] = self.string(idx)
+        return value
+
+    def records(self) -> list:
+        """
+        One ImageJob per job, in image order. Views hold only a position, so
+        the per-process cost is a small object per job rather than a decoded
+        copy of the image.
+        """
+        if self._job_records is None:
+            self._job_records = [ImageJob(self, i) for i in range(self._count)]
+        return self._job_records
+
+    def find(self, jid: str):
+        """ImageJob with this id, or None; binary search over the id order."""
+        order, ids = self._id_order, self._ids
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(ids[order[mid]]) < jid:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self.string(ids[order[lo]]) == jid:
+            return self.records()[order[lo]]
+        return None
+
+
+def _image_field(k: int, shared: bool = False):
+    if shared:
+        return property(lambda self: self._image.shared_string(
+            self._image._records[self._i * self._image._stride + k]))
+    return property(lambda self: self._image.string(
+        self._image._records[self._i * self._image._stride + k]))
+
+
+class ImageJob:
+    """
+    One job in a mapped JobsImage, read field by field from the mapping.
+    Same attributes and to_dict() as JobRecord; nothing is decoded until it
+    is read, so the job data stays in the shared page cache.
+    """
+    __slots__ = ("_image", "_i")
+
+    def __init__(self, image: JobsImage, i: int):
+        self._image = image
+        self._i = i
+
+    @property
+    def id(self) -> str:
+        return self._image.string(self._image._ids[self._i])
+
+    @property
+    def tags(self) -> tuple:
+        image = self._image
+        base = self._i * image._stride + len(JOB_IMAGE_FIELDS)
+        start, count = image._records[base], image._records[base + 1]
+        return tuple(image.shared_string(image._tag_refs[t]) for t in range(start, start + count))
+
+    @property
+    def salary_min(self):
+        return self._image._salaries[4 * self._i] if self._image._salaries[4 * self._i + 1] else None
+
+    @property
+    def salary_max(self):
+        return self._image._salaries[4 * self._i + 1] or None
+
+    @property
+    def salary_currency(self) -> str:
+        return self._image.shared_string(self._image._salaries[4 * self._i + 2])
+
+    @property
+    def salary_period(self) -> str:
+        return self._image.shared_string(self._image._salaries[4 * self._i + 3])
+
+    @property
+    def countries(self) -> tuple:
+        joined = self._image.shared_string(self._image._locations[3 * self._i])
+        return tuple(joined.split(",")) if joined else ()
+
+    @property
+    def region(self) -> str:
+        return self._image.shared_string(self._image._locations[3 * self._i + 1])
+
+    @property
+    def remote_scope(self) -> str:
+        return self._image.shared_string(self._image._locations[3 * self._i + 2])
+
+    @property
+    def posted_ts(self):
+        return self._image._flags[2 * self._i] or None
+
+    @property
+    def relevant(self) -> bool:
+        return self._image._flags[2 * self._i + 1] == 1
+
+    to_dict = JobRecord.to_dict
+
+
+for _k, _field in enumerate(JOB_IMAGE_FIELDS):
+    setattr(ImageJob, _field, _image_field(_k, _field in JobsImage._SHARED_FIELDS))
+del _k, _field
+
+
+_mapped_images = {}  # path -> JobsImage currently mapped by this process
+
+
+def open_jobs_image(path: Path):
+    """Return the mapped image for path, re-mapping it after an atomic swap."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _mapped_images.pop(path, None)
+        return None
+    image = _mapped_images.get(path)
+    if image is not None and image.stamp == (st.st_ino, st.st_mtime_ns, st.st_size):
+        return image
+    try:
+        image = JobsImage(path)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not map %s: %s", path, e)
+        return None
+    _mapped_images[path] = image
+    return image
+
+
+def materialize_snapshot_image(data: dict):
+    """Derive jobs_snapshot.bin from the jobs_snapshot section of dashboard data."""
+    snapshot = data.get("jobs_snapshot", {})
+    if not isinstance(snapshot, dict):
+        snapshot = {}
+    jobs = [normalize_ingested_job(j) for j in snapshot.get("jobs", [])]
+    jobs = [j for j in jobs if j.get("title") and j.get("url")]
+    write_jobs_image(JOBS_SNAPSHOT_IMAGE, jobs, {
+        "fetched_at": snapshot.get("fetched_at"),
+        "updated_at": snapshot.get("updated_at"),
+        "source":     snapshot.get("source"),
+        "sources":    snapshot.get("sources", []),
+    })
+
+
+def load_snapshot_image():
+    image = open_jobs_image(JOBS_SNAPSHOT_IMAGE)
+    if image is None and DASHBOARD_DATA_FILE.exists():
+        # First start after an upgrade: derive the image from the JSON document.
+        materialize_snapshot_image(load_current_data())
+        image = open_jobs_image(JOBS_SNAPSHOT_IMAGE)
+    return image
+
+
+def load_cache_image():
+    image = open_jobs_image(JOBS_CACHE_IMAGE)
+    if image is None and JOBS_CACHE_FILE.exists():
+        try:
+            cache = json.loads(JOBS_CACHE_FILE.read_text())
+            write_jobs_image(JOBS_CACHE_IMAGE, cache.get("all_jobs", []), {"ts": cache.get("ts", 0)})
+        except Exception:
+            return None
+        image = open_jobs_image(JOBS_CACHE_IMAGE)
+    return image
+
+
+def is_snapshot_fresh(updated_at) -> bool:
+    if not updated_at:
+        return False
+    try:
+        su = datetime.fromisoformat(updated_at)
+        if su.tzinfo is None:
+            su = su.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - su).total_seconds() <= JOBS_SNAPSHOT_MAX_AGE_SECONDS
+    except Exception:
+        return False
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  TIME-SERIES ROLLUPS  (updated incrementally at ingest)
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# Each snapshot ingest / jobs-cache refresh folds one observation of the live
+# job set into the current hourly and daily bucket. A bucket holds the latest
+# counts seen in that period, so charting a series never re-scans raw jobs.
+# Only the top ROLLUP_MAX_TAGS tags are kept per bucket; in a bucket marked
+# tags_truncated a missing tag is unknown (null in /api/trends.py), not 0.
+
+ROLLUP_RETENTION  = {"hourly": 7 * 24, "daily": 90}  # buckets kept per series
+ROLLUP_DIMENSIONS = ("tags", "sources", "locations", "remote")
+ROLLUP_MAX_TAGS   = 25
+
+def location_bucket(j: JobRecord) -> str:
+    """Rollup bucket: any remote scope is "Remote", otherwise the canonical region."""
+    if j.remote_scope in REMOTE_ANY:
+        return "Remote"
+    return j.region or "Unknown"
+
+
+def rollup_counts(records) -> dict:
+    """Counts for one observation of the jobs the dashboard would show."""
+    total = remote = 0
+    tags, sources, locations = {}, {}, {}
+    for j in records:
+        if not is_relevant_role(j) or not is_recent_job(j):
+            continue
+        total += 1
+        if "remote" in j.type.lower() or "remote" in j.location.lower():
+            remote += 1
+        src = j.source or "Unknown"
+        sources[src] = sources.get(src, 0) + 1
+        bucket = location_bucket(j)
+        locations[bucket] = locations.get(bucket, 0) + 1
+        for t in j.tags:
+            tags[t] = tags.get(t, 0) + 1
+    top_tags = dict(sorted(tags.items(), key=lambda x: -x[1])[:ROLLUP_MAX_TAGS])
+    return {
+        "total":          total,
+        "remote":         remote,
+        "onsite":         total - remote,
+        "tags":           top_tags,
+        "tags_truncated": len(tags) > ROLLUP_MAX_TAGS,
+        "sources":        sources,
+        "locations":      locations,
+    }
+
+
+def update_rollups(data_source: str, records, observed_at=None):
+    """Fold one observation into the current hourly and daily buckets."""
+    now = observed_at or datetime.now(timezone.utc)
+    counts = rollup_counts(records)
+    bucket_keys = {
+        "hourly": now.strftime("%Y-%m-%dT%H:00Z"),
+        "daily":  now.strftime("%Y-%m-%d"),
+    }
+    with file_lock("rollups"):
+        try:
+            rollups = json.loads(ROLLUPS_FILE.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            rollups = {}
+        series = rollups.setdefault(data_source, {})
+        for granularity, key in bucket_keys.items():
+            buckets = series.setdefault(granularity, {})
+            samples = buckets.get(key, {}).get("samples", 0)
+            buckets[key] = dict(counts, samples=samples + 1, observed_at=now.isoformat())
+            for old in sorted(buckets)[:-ROLLUP_RETENTION[granularity]]:
+                del buckets[old]
+        write_json_atomic(ROLLUPS_FILE, rollups)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  STATS SUMMARY  (precomputed whenever data changes)
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# stats.json holds a few hundred bytes of counts per data source (jobs images,
+# news cache, dashboard document), rewritten by the same writers that call
+# notify_change(). /api/stats.py only adds request-time ages and cache states,
+# so monitoring never pays for a filter run or an upstream fetch.
+
+STATS_TOP_TAGS = 10
+
+
+def job_stats(records, **meta) -> dict:
+    counts = rollup_counts(records)
+    return dict(
+        meta,
+        raw=len(records),
+        total=counts["total"],
+        remote=counts["remote"],
+        onsite=counts["onsite"],
+        sources=counts["sources"],
+        locations=counts["locations"],
+        top_tags=list(counts["tags"])[:STATS_TOP_TAGS],
+        salary_histogram=salary_histogram(records),
+    )
+
+
+def dashboard_stats(data: dict) -> dict:
+    meta = data.get("meta") or {}
+    snapshot = data.get("jobs_snapshot") or {}
+    return {
+        "last_updated":   meta.get("last_updated"),
+        "update_source":  meta.get("update_source"),
+        "market_status":  data.get("market_status"),
+        "kpis":           len(data.get("kpi_updates") or {}),
+        "alerts":         len(data.get("trend_alerts") or []),
+        "insights":       len(data.get("new_insights") or []),
+        "history":        len(data.get("history") or []),
+        "snapshot_jobs":  len(snapshot.get("jobs") or []),
+    }
+
+
+def update_stats(section: str, value: dict, key: str = None):
+    """Replace one section (or one key of the jobs section) of stats.json."""
+    with file_lock("stats"):
+        try:
+            stats = json.loads(STATS_FILE.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            stats = {}
+        if key is None:
+            stats[section] = value
+        else:
+            stats.setdefault(section, {})[key] = value
+        stats["generated_at"] = datetime.now(timezone.utc).isoformat()
+        write_json_atomic(STATS_FILE, stats)
+
+
+def rebuild_stats():
+    """Derive stats.json from whatever is already on disk (first start after upgrade)."""
+    snapshot = load_snapshot_image()
+    if snapshot is not None:
+        best_effort(lambda: update_stats("jobs", job_stats(snapshot.records(),
+                                                           updated_at=snapshot.meta.get("updated_at"),
+                                                           fetched_at=snapshot.meta.get("fetched_at")),
+                                         "hunter_snapshot"), "Stats update for jobs")
+    cache = load_cache_image()
+    if cache is not None:
+        best_effort(lambda: update_stats("jobs", job_stats(cache.records(), ts=cache.meta.get("ts", 0)),
+                                         "market_apis"), "Stats update for jobs")
+    news = read_json_cached(NEWS_CACHE_FILE)
+    if isinstance(news, dict):
+        best_effort(lambda: update_stats("news", {"total": news.get("total", 0), "fetched_at": news.get("fetched_at"),
+                                                  "ts": news.get("ts", 0)}), "Stats update for news")
+    best_effort(lambda: update_stats("dashboard", dashboard_stats(dashboard_document())),
+                "Stats update for dashboard")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SAVED SEARCHES  (percolated at ingest)
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# saved_searches.json holds the registered query/location/type combinations;
+# saved_search_results.json holds, per search and data source, the matching
+# job ids with the time each was first matched. Every jobs ingest percolates
+# only the postings that are new or changed since the last one (tracked by
+# per-job fingerprints): each is checked against the searches keyed by one of
+# its text trigrams, not against every search. Reading a search is then a
+# lookup, and "new since last view" is first_seen > last_viewed_at.
+
+SAVED_SEARCHES_MAX = 100
+SAVED_SEARCH_LIMITS = {"name": 80, "query": 200, "location": 80, "type": 20}
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _job_fingerprint(j: JobRecord) -> int:
+    return zlib.crc32(f"{search_text(j)}\x00{j.location}\x00{j.type}".encode("utf-8"))
+
+
+def percolate(searches: list, records: list, positions) -> dict:
+    """search id -> positions (among `positions`) of relevant jobs it matches."""
+    texts = {p: search_text(records[p]) for p in positions if is_relevant_role(records[p])}
+    grams = {p: _trigrams(text) for p, text in texts.items()}
+    doc_freq = {}
+    for job_grams in grams.values():
+        for g in job_grams:
+            doc_freq[g] = doc_freq.get(g, 0) + 1
+
+    # A query can only be a substring of texts containing all of its trigrams,
+    # so key each search by its rarest one. Searches without a usable query
+    # use their location posting list, or else every job.
+    keyed, unkeyed, places = {}, [], {}
+    for search in searches:
+        place = location_constraints(search.get("location", ""))
+        if place:
+            places[search["id"]] = location_index(records).select(**place)
+        query = search.get("query", "").lower()
+        if len(query) >= 3:
+            key = min(_trigrams(query), key=lambda g: (doc_freq.get(g, 0), g))
+            keyed.setdefault(key, []).append(search)
+        else:
+            unkeyed.append(search)
+
+    def accepts(search, p):
+        query = search.get("query", "").lower()
+        return ((not query or query in texts[p])
+                and (search["id"] not in places or p in places[search["id"]])
+                and matches_job_type(records[p], search.get("type", "")))
+
+    matches = {search["id"]: set() for search in searches}
+    for search in unkeyed:
+        candidates = places.get(search["id"], texts.keys())
+        matches[search["id"]].update(p for p in candidates if p in texts and accepts(search, p))
+    if keyed:
+        for p, job_grams in grams.items():
+            for g in job_grams:
+                for search in keyed.get(g, ()):
+                    if accepts(search, p):
+                        matches[search["id"]].add(p)
+    return matches
+
+
+def load_saved_searches() -> dict:
+    try:
+        doc = json.loads(SAVED_SEARCHES_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        doc = {}
+    doc.setdefault("searches", {})
+    return doc
+
+
+def load_saved_search_results() -> dict:
+    try:
+        doc = json.loads(SAVED_SEARCH_RESULTS_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        doc = {}
+    doc.setdefault("sources", {})
+    doc.setdefault("results", {})
+    return doc
+
+
+def update_saved_search_results(data_source: str, records: list):
+    """Percolate new/changed jobs of one data source against every saved search."""
+    now = datetime.now(timezone.utc).isoformat()
+    with file_lock("searches"):
+        searches = list(load_saved_searches()["searches"].values())
+        doc = load_saved_search_results()
+        old_prints = doc["sources"].get(data_source, {}).get("fingerprints", {})
+        prints = {j.id: _job_fingerprint(j) for j in records}
+        changed = [p for p, j in enumerate(records) if old_prints.get(j.id) != prints[j.id]]
+
+        # Searches registered before this source was ever percolated see every job.
+        fresh = [s for s in searches if data_source not in doc["results"].get(s["id"], {})]
+        matched = percolate([s for s in searches if s not in fresh], records, changed)
+        matched.update(percolate(fresh, records, range(len(records))))
+
+        changed_ids = {records[p].id for p in changed}
+        for search in searches:
+            previous = doc["results"].get(search["id"], {}).get(data_source, {})
+            kept = {jid: ts for jid, ts in previous.items() if jid in prints and jid not in changed_ids}
+            for p in sorted(matched[search["id"]]):
+                jid = records[p].id
+                kept[jid] = previous.get(jid, now)  # an edited posting keeps its first_seen
+            doc["results"].setdefault(search["id"], {})[data_source] = kept
+        doc["sources"][data_source] = {"fingerprints": prints, "percolated_at": now,
+                                       "percolated": len(changed)}
+        write_json_atomic(SAVED_SEARCH_RESULTS_FILE, doc)
+
+
+def percolate_new_search(search: dict):
+    """Fill a just-registered search's results from the current images."""
+    now = datetime.now(timezone.utc).isoformat()
+    with file_lock("searches"):
+        doc = load_saved_search_results()
+        results = doc["results"].setdefault(search["id"], {})
+        for data_source, image in (("hunter_snapshot", load_snapshot_image()),
+                                   ("market_apis", load_cache_image())):
+            if image is None or data_source not in doc["sources"]:
+                continue  # the next ingest of this source percolates it in full
+            records = image.records()
+            matched = percolate([search], records, range(len(records)))[search["id"]]
+            results[data_source] = {records[p].id: now for p in sorted(matched)}
+        write_json_atomic(SAVED_SEARCH_RESULTS_FILE, doc)
+
+
+def saved_search_view(search: dict, data_source, image) -> list:
+    """[(JobRecord, first_seen, is_new)] currently shown for a search, newest match first."""
+    if image is None:
+        return []
+    results = read_json_cached(SAVED_SEARCH_RESULTS_FILE, {}) or {}
+    matched = results.get("results", {}).get(search["id"], {}).get(data_source, {})
+    seen_at = search.get("last_viewed_at") or ""
+    rows = [(image.find(jid), ts, ts > seen_at) for jid, ts in matched.items()]
+    rows = [row for row in rows if row[0] is not None]
+    rows = [row for row in rows if is_recent_job(row[0])]
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CHANGE NOTIFICATIONS  (cross-worker, file based)
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# Writers (save_data, jobs/news cache refreshes) pass the ETag of every section
+# they own to notify_change(). If any ETag moved, changes.json gets a new
+# version listing the changed sections. /api/events.py streams those notices
+# from every worker by watching the file, so no shared memory is needed.
+
+CHANGES_RECENT_KEPT   = 20
+SSE_POLL_SECONDS      = 1.0
+SSE_HEARTBEAT_SECONDS = 15
+SSE_MAX_STREAM_SECONDS = 300  # EventSource reconnects with Last-Event-ID
+# Each open stream holds a gthread thread. Keep well under gunicorn's
+# `threads` so streams can never starve normal API and health requests;
+# clients over the cap get a 503 and poll instead.
+SSE_MAX_STREAMS_PER_WORKER = int(os.environ.get("SSE_MAX_STREAMS_PER_WORKER", "4"))
+SSE_RETRY_AFTER = 60
+
+_sse_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS_PER_WORKER)
+
+
+def client_disconnected(sock) -> bool:
+    """True once the peer closed its end; lets a stream free its slot without waiting for a write to fail."""
+    if sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable) and sock.recv(1, socket.MSG_PEEK) == b""
+    except (OSError, ValueError):
+        return True
+
+
+def jobs_etag() -> str:
+    """ETag of whatever /api/jobs.py would currently serve from."""
+    parts = []
+    for image in (open_jobs_image(JOBS_SNAPSHOT_IMAGE), open_jobs_image(JOBS_CACHE_IMAGE)):
+        parts.append(json.dumps(image.meta, sort_keys=True, default=str) if image is not None else "")
+    return section_etag("|".join(parts).encode("utf-8"))
+
+
+def notify_change(etags: dict):
+    """Record a new change version if any of the given section ETags moved."""
+    try:
+        with file_lock("changes"):
+            try:
+                current = json.loads(CHANGES_FILE.read_text())
+            except (FileNotFoundError, json.JSONDecodeError):
+                current = {"version": 0, "etags": {}, "recent": []}
+            changed = sorted(k for k, v in etags.items() if current["etags"].get(k) != v)
+            if not changed:
+                return
+            version = current["version"] + 1
+            notice = {
+                "version": version,
+                "ts":      datetime.now(timezone.utc).isoformat(),
+                "changed": changed,
+            }
+            write_json_atomic(CHANGES_FILE, {
+                "version": version,
+                "etags":   dict(current["etags"], **etags),
+                "recent":  (current["recent"] + [notice])[-CHANGES_RECENT_KEPT:],
+            })
+    except Exception as e:
+        logger.warning("Change notification failed: %s", e)
+
+
+def change_notice_since(changes: dict, last_version: int) -> dict:
+    """
+    Collapse every change after last_version into a single notice. A version
+    older than the kept history, or newer than the current one (changes.json
+    was reset), gets every etag: anything may have changed.
+    """
+    recent = [n for n in changes.get("recent", []) if n["version"] > last_version]
+    oldest_kept = changes["recent"][0]["version"] if changes.get("recent") else 0
+    if last_version < oldest_kept - 1 or last_version > changes["version"]:
+        changed = sorted(changes.get("etags", {}))
+    else:
+        changed = sorted({name for n in recent for name in n["changed"]})
+    return {
+        "version": changes["version"],
+        "changed": changed,
+        "etags":   {k: changes["etags"][k] for k in changed if k in changes.get("etags", {})},
+    }
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  NEWS LOGIC  (ported from cgi-bin/news.py)
 # ══════════════════════════════════════════════════════════════════════════════
@@ -432,13 +1805,9 @@ def fetch_rss(url, source_name, timeout=12):
 
 
 def get_news_cached():
-    if NEWS_CACHE_FILE.exists():
-        try:
-            cache = json.loads(NEWS_CACHE_FILE.read_text())
-            if time.time() - cache.get("ts", 0) < CACHE_TTL:
-                return cache
-        except Exception:
-            pass
+    cache = read_json_cached(NEWS_CACHE_FILE)
+    if isinstance(cache, dict) and time.time() - cache.get("ts", 0) < CACHE_TTL:
+        return cache
     return None
 
 
@@ -503,6 +1872,57 @@ def load_current_data() -> dict:
     }
 
 
+def dashboard_document() -> dict:
+    """Read-side view of dashboard_data.json, parsed once per file version."""
+    data = read_json_cached(DASHBOARD_DATA_FILE)
+    return data if isinstance(data, dict) else load_current_data()
+
+
+_encoded_sections = {}  # section -> (document, json bytes, etag)
+
+
+def encode_section(value) -> bytes:
+    return json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def section_etag(body: bytes) -> str:
+    return hashlib.sha1(body).hexdigest()[:16]
+
+
+def encoded_section(data: dict, name: str):
+    """Serialize one top-level section once per document version."""
+    cached = _encoded_sections.get(name)
+    if cached and cached[0] is data:
+        return cached[1], cached[2]
+    body = encode_section(data.get(name))
+    etag = section_etag(body)
+    _encoded_sections[name] = (data, body, etag)
+    return body, etag
+
+
+def age_seconds_since(timestamp):
+    if not timestamp:
+        return None
+    try:
+        ts = datetime.fromisoformat(timestamp)
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        return int((datetime.now(timezone.utc) - ts).total_seconds())
+    except Exception:
+        return None
+
+
+def paginate(items: list, page: int, page_size: int) -> dict:
+    start = (page - 1) * page_size
+    return {
+        "items":       items[start:start + page_size],
+        "total":       len(items),
+        "page":        page,
+        "page_size":   page_size,
+        "total_pages": (len(items) + page_size - 1) // page_size,
+    }
+
+
 def save_data(data: dict):
     """Write data dict to dashboard_data.json atomically."""
     tmp_file = str(DASHBOARD_DATA_FILE) + ".tmp"
@@ -510,6 +1930,30 @@ def save_data(data: dict):
         json.dump(data, f, indent=2, default=str)
     os.replace(tmp_file, str(DASHBOARD_DATA_FILE))  # atomic on POSIX
 
+    # Re-materialize the shared jobs image only when the snapshot changed.
+    snapshot = data.get("jobs_snapshot") or {}
+    image = open_jobs_image(JOBS_SNAPSHOT_IMAGE)
+    if image is None or image.meta.get("updated_at") != snapshot.get("updated_at"):
+        materialize_snapshot_image(data)
+        image = open_jobs_image(JOBS_SNAPSHOT_IMAGE)
+        if image is not None and len(image):
+            best_effort(lambda: update_rollups("hunter_snapshot", image.records()),
+                        "Rollup update for hunter_snapshot")
+            best_effort(lambda: update_saved_search_results("hunter_snapshot", image.records()),
+                        "Saved-search percolation for hunter_snapshot")
+        if image is not None:
+            best_effort(lambda: publish_job_pages("hunter_snapshot", image),
+                        "Pre-rendering hunter_snapshot pages")
+            best_effort(lambda: update_stats("jobs", job_stats(image.records(),
+                                                               updated_at=image.meta.get("updated_at"),
+                                                               fetched_at=image.meta.get("fetched_at")),
+                                             "hunter_snapshot"), "Stats update for jobs")
+    best_effort(lambda: update_stats("dashboard", dashboard_stats(data)), "Stats update for dashboard")
+
+    etags = {name: section_etag(encode_section(value)) for name, value in data.items()}
+    etags["jobs"] = jobs_etag()
+    notify_change(etags)
+
 
 def merge_update(current: dict, payload: dict) -> dict:
     """
@@ -571,6 +2015,7 @@ def merge_update(current: dict, payload: dict) -> dict:
             "updated_at": now_iso,
             "source": update_source,
             "sources": incoming_snapshot.get("sources", []),
+            "snapshot_id": incoming_snapshot.get("snapshot_id"),
             "total": len(normalized_jobs),
             "jobs": normalized_jobs,
         }
@@ -579,6 +2024,470 @@ def merge_update(current: dict, payload: dict) -> dict:
     return merged
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  WARM-UP / READINESS
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# gunicorn.conf.py runs warm_up() in the master after preload (so workers
+# inherit the structures copy-on-write) and again in each worker before it
+# accepts connections. Without those hooks the first request warms lazily.
+# Warm-up is only an optimisation: a failure is logged and /health/ready keeps
+# reporting not-ready, and requests build what they need on demand.
+
+_warmup = {
+    "ready":        False,
+    "pid":          None,
+    "warmup_ms":    None,
+    "startup_ms":   None,
+    "warmed_at":    None,
+}
+_warmup_lock = threading.Lock()
+
+
+def warm_up():
+    """Build every read-side structure the request path would otherwise build lazily."""
+    t0 = time.time()
+
+    data = dashboard_document()
+    for name in data:
+        encoded_section(data, name)
+    for image in (load_snapshot_image(), load_cache_image()):
+        if image is not None:
+            salary_index(image.records())
+            location_index(image.records())
+            source_index(image.records())
+            tag_index(image.records())
+    read_json_cached(ROLLUPS_FILE)
+    get_news_cached()
+
+    done = time.time()
+    _warmup.update({
+        "ready":      True,
+        "pid":        os.getpid(),
+        "warmup_ms":  round((done - t0) * 1000, 1),
+        "startup_ms": round((done - PROCESS_STARTED_AT) * 1000, 1),
+        "warmed_at":  datetime.now(timezone.utc).isoformat(),
+    })
+    logger.info("Warm-up done in pid %d: %.1f ms (%.1f ms since start)",
+                os.getpid(), _warmup["warmup_ms"], _warmup["startup_ms"])
+
+
+def ensure_warm():
+    """warm_up() once per process, however many threads ask at the same time; never raises."""
+    if _warmup["ready"]:
+        return
+    with _warmup_lock:
+        if not _warmup["ready"]:
+            best_effort(warm_up, "Warm-up")
+
+
+def mark_worker_started():
+    """Called post-fork: readiness is per worker, not inherited from the master."""
+    global PROCESS_STARTED_AT, _warmup_lock
+    PROCESS_STARTED_AT = time.time()
+    _warmup_lock = threading.Lock()
+    _warmup["ready"] = False
+
+
+@app.before_request
+def _ensure_warm():
+    if request.path not in ("/health", "/health/live", "/health/ready"):
+        ensure_warm()
+
+
+# ── Batched snapshots ─────────────────────────────────────────────────────────
+# Large snapshots arrive as several POSTs sharing one jobs_snapshot.snapshot_id
+# (with batch_index / batch_count). Batches are staged on disk; the request
+# that delivers the last missing batch commits the whole snapshot at once,
+# together with the rest of its payload.
+SNAPSHOT_ID_RE = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+
+
+def validate_snapshot_batch(snapshot: dict):
+    """Return an error string for a malformed batch header, else None."""
+    if not isinstance(snapshot.get("snapshot_id"), str) or not SNAPSHOT_ID_RE.match(snapshot["snapshot_id"]):
+        return "'jobs_snapshot.snapshot_id' must be 8-64 chars of [A-Za-z0-9_-]"
+    count, index = snapshot.get("batch_count"), snapshot.get("batch_index")
+    if not isinstance(count, int) or not 1 <= count <= JOBS_SNAPSHOT_MAX_BATCHES:
+        return f"'jobs_snapshot.batch_count' must be an integer in 1..{JOBS_SNAPSHOT_MAX_BATCHES}"
+    if not isinstance(index, int) or not 0 <= index < count:
+        return "'jobs_snapshot.batch_index' must be an integer in 0..batch_count-1"
+    return None
+
+
+def stage_snapshot_batch(snapshot: dict):
+    """
+    Stage one batch. Returns (jobs, received): jobs is the assembled list once
+    every batch is present (staging is then removed), otherwise None.
+    """
+    with file_lock("staging"):
+        # Forget abandoned uploads.
+        if SNAPSHOT_STAGING_DIR.exists():
+            for stale in SNAPSHOT_STAGING_DIR.iterdir():
+                if time.time() - stale.stat().st_mtime > SNAPSHOT_STAGING_TTL:
+                    shutil.rmtree(stale, ignore_errors=True)
+
+        batch_dir = SNAPSHOT_STAGING_DIR / snapshot["snapshot_id"]
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(batch_dir / f"batch-{snapshot['batch_index']:04d}.json", snapshot.get("jobs", []))
+
+        count = snapshot["batch_count"]
+        paths = [batch_dir / f"batch-{i:04d}.json" for i in range(count)]
+        received = sum(1 for p in paths if p.exists())
+        if received < count:
+            return None, received
+
+        jobs = []
+        for p in paths:
+            jobs.extend(json.loads(p.read_text()))
+        shutil.rmtree(batch_dir, ignore_errors=True)
+        return jobs, received
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  UPSTREAM REFRESHES  (coalescing + admission control for force=1)
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# A forced refresh never blocks the request. Within FORCE_REFRESH_COOLDOWN of
+# the last refresh the current cache is served as-is; otherwise the request
+# must pass a per-client token bucket (data/force_clients.json) and a global
+# one (data/force_bucket.json), both shared by every worker, and win a
+# non-blocking refresh lock shared by every worker. The winner starts
+# the upstream fetch on a background thread; everyone else is told a refresh
+# is pending and gets the current data (or 202 when there is none) plus
+# Retry-After. Cold, non-forced fetches take the same lock blocking, so
+# concurrent cold requests share one fetch.
+
+REFRESH_RETRY_AFTER = 10  # seconds; typical upstream fetch time
+FORCE_CLIENT_BURST          = int(os.environ.get("FORCE_CLIENT_BURST", "2"))
+FORCE_CLIENT_REFILL_SECONDS = int(os.environ.get("FORCE_CLIENT_REFILL_SECONDS", "300"))
+FORCE_GLOBAL_BURST          = int(os.environ.get("FORCE_GLOBAL_BURST", "6"))
+FORCE_GLOBAL_REFILL_SECONDS = int(os.environ.get("FORCE_GLOBAL_REFILL_SECONDS", "60"))
+FORCE_CLIENTS_TRACKED = 10_000
+
+
+class SharedTokenBuckets:
+    """
+    Token buckets (`capacity` tokens, refilled one every `refill_seconds`)
+    keyed by name, whose state lives in data/<name>.json under a flock so
+    every gunicorn worker draws from the same tokens. Once more than
+    `max_keys` buckets are stored, the ones that have refilled are dropped:
+    a full bucket is the same as no bucket.
+    """
+
+    def __init__(self, name: str, capacity: int, refill_seconds: float, max_keys: int = 1):
+        self.name = name
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.max_keys = max_keys
+
+    def _update(self, key: str, change):
+        """Refill key's bucket, apply change(tokens) -> (tokens, result) and persist; returns result."""
+        path = DATA_DIR / f"{self.name}.json"
+        with file_lock(self.name):
+            try:
+                state = json.loads(path.read_text())
+            except (OSError, ValueError):
+                state = {}
+            now = time.time()
+
+            def refilled(bucket):
+                elapsed = max(0.0, now - bucket.get("updated", now))
+                return min(self.capacity, bucket.get("tokens", self.capacity) + elapsed / self.refill_seconds)
+
+            buckets = {k: v for k, v in state.items() if isinstance(v, dict)}
+            if len(buckets) >= self.max_keys:
+                buckets = {k: v for k, v in buckets.items() if k == key or refilled(v) < self.capacity}
+            tokens, result = change(refilled(buckets.get(key, {})))
+            buckets[key] = {"tokens": tokens, "updated": now}
+            write_json_atomic(path, buckets)
+        return result
+
+    def take(self, key: str) -> float:
+        """Take a token from key's bucket: 0 on success, else seconds until one is available."""
+        def change(tokens):
+            if tokens >= 1:
+                return tokens - 1, 0
+            return tokens, (1 - tokens) * self.refill_seconds
+        return self._update(key, change)
+
+    def give_back(self, key: str):
+        self._update(key, lambda tokens: (min(self.capacity, tokens + 1), None))
+
+
+_global_force_bucket = SharedTokenBuckets("force_bucket", FORCE_GLOBAL_BURST, FORCE_GLOBAL_REFILL_SECONDS)
+_client_force_buckets = SharedTokenBuckets("force_clients", FORCE_CLIENT_BURST, FORCE_CLIENT_REFILL_SECONDS,
+                                           max_keys=FORCE_CLIENTS_TRACKED)
+
+
+def client_key() -> str:
+    """Client address as seen by nginx (X-Real-IP), else the socket peer."""
+    forwarded = request.headers.get("X-Forwarded-For", "").split(",")[0].strip()
+    return request.headers.get("X-Real-IP", "").strip() or forwarded or request.remote_addr or "unknown"
+
+
+def admit_forced_refresh() -> float:
+    """Charge the client's and the global bucket: 0 if admitted, else Retry-After seconds."""
+    key = client_key()
+    wait = _client_force_buckets.take(key)
+    if wait:
+        return wait
+    wait = _global_force_bucket.take("global")
+    if wait:
+        _client_force_buckets.give_back(key)  # not this client's fault
+    return wait
+
+
+def start_background_refresh(name: str, refresh) -> bool:
+    """Run refresh() on a thread if no worker is already refreshing `name`."""
+    f = open(DATA_DIR / f".refresh-{name}.lock", "w")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        f.close()
+        return False
+
+    def run():
+        try:
+            refresh()
+        except Exception as e:
+            logger.warning("Background %s refresh failed: %s", name, e)
+        finally:
+            f.close()  # releases the flock
+
+    threading.Thread(target=run, name=f"refresh-{name}", daemon=True).start()
+    return True
+
+
+@contextmanager
+def refresh_lock(name: str):
+    """Blocking variant for cold fetches: wait for an in-flight refresh instead of duplicating it."""
+    with open(DATA_DIR / f".refresh-{name}.lock", "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def forced_refresh(name: str, cache_age, refresh) -> dict:
+    """
+    Decide what a force=1 request gets. Returns the response flags:
+    refresh is one of cooldown / started / pending / throttled.
+    """
+    if cache_age is not None and cache_age < FORCE_REFRESH_COOLDOWN:
+        return {"refresh": "cooldown", "refresh_pending": False}
+    wait = admit_forced_refresh()
+    if wait:
+        return {"refresh": "throttled", "refresh_pending": False, "retry_after": max(1, int(wait + 0.999))}
+    started = start_background_refresh(name, refresh)
+    if not started:
+        _global_force_bucket.give_back("global")  # coalesced into the in-flight refresh
+    return {
+        "refresh":         "started" if started else "pending",
+        "refresh_pending": True,
+        "retry_after":     REFRESH_RETRY_AFTER,
+    }
+
+
+def refresh_jobs_cache() -> list:
+    """Fetch market APIs, write the jobs cache + image. Returns the job records."""
+    logger.info("Fetching fresh jobs from APIs")
+    fetched = fetch_remotive() + fetch_remoteok() + fetch_arbeitnow()
+    ts = time.time()
+    image = None
+    try:
+        write_json_atomic(JOBS_CACHE_FILE, {"all_jobs": fetched, "ts": ts})
+        write_jobs_image(JOBS_CACHE_IMAGE, fetched, {"ts": ts})
+        image = open_jobs_image(JOBS_CACHE_IMAGE)
+    except Exception:
+        pass
+    # Serve views over the fresh image when it was written; decode only as a fallback.
+    records = image.records() if image is not None else [JobRecord.from_dict(j) for j in fetched]
+    best_effort(lambda: update_rollups("market_apis", records), "Rollup update for market_apis")
+    best_effort(lambda: update_stats("jobs", job_stats(records, ts=ts), "market_apis"), "Stats update for jobs")
+    best_effort(lambda: update_saved_search_results("market_apis", records),
+                "Saved-search percolation for market_apis")
+    if image is not None:
+        best_effort(lambda: publish_job_pages("market_apis", image), "Pre-rendering market_apis pages")
+    notify_change({"jobs": jobs_etag()})
+    return records
+
+
+def refresh_news_cache() -> dict:
+    """Fetch every RSS feed and write the news cache. Returns the cached document."""
+    logger.info("Fetching fresh news from RSS feeds")
+    all_items = []
+    for name, url in RSS_FEEDS.items():
+        all_items.extend(fetch_rss(url, name))
+
+    # Deduplicate by title similarity
+    seen   = set()
+    unique = []
+    for item in all_items:
+        key = item["title"][:50].lower()
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+
+    result = {
+        "news":       unique[:30],
+        "total":      len(unique),
+        "sources":    list(RSS_FEEDS.keys()),
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "ts":         time.time(),
+        "from_cache": False,
+    }
+
+    # Save cache
+    try:
+        write_json_atomic(NEWS_CACHE_FILE, result)
+    except Exception:
+        pass
+    best_effort(lambda: update_stats("news", {"total": result["total"], "fetched_at": result["fetched_at"],
+                                              "ts": result["ts"]}), "Stats update for news")
+    notify_change({"news": section_etag(encode_section(unique[:30]))})
+    return result
+
+
+def refresh_response(data, flags: dict, status=200):
+    resp = cors_response(dict(data, **flags), status)
+    if flags.get("retry_after"):
+        resp.headers["Retry-After"] = str(flags["retry_after"])
+    return resp
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PRE-RENDERED JOB PAGES  (written at ingest, served for unfiltered requests)
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# Most /api/jobs.py traffic is the unfiltered listing. Whenever a jobs image is
+# written, its unfiltered pages (JSON and columnar, per pre-rendered page size)
+# are rendered into data/pages/<data_source>/<render>/ together with a .gz
+# variant, and data/pages/<data_source>.json points at that render. Only the
+# first page is rendered inline with the write; the rest follow on a background
+# thread and are published only if the image is still current. The
+# pointer is only used while it names the image currently served and before
+# its expires_at, the next moment a posting enters or leaves the freshness
+# window; after that the page is re-rendered in the background and requests
+# take the normal path meanwhile. With JOBS_PAGES_ACCEL_PREFIX set, nginx
+# sends the file itself (X-Accel-Redirect, gzip_static).
+
+JOBS_PRERENDER_FORMATS    = ("json", "columnar")
+JOBS_PRERENDER_PAGE_SIZES = tuple(int(n) for n in os.environ.get("JOBS_PRERENDER_PAGE_SIZES", "20").split(",")
+                                  if n.strip().isdigit() and 0 < int(n) <= 100)
+JOBS_PAGES_ACCEL_PREFIX   = os.environ.get("JOBS_PAGES_ACCEL_PREFIX", "")  # e.g. "/_pages/"
+JOBS_PAGES_KEPT = 3  # renders kept per data source, so in-flight sends never lose their file
+
+
+def listing_expires_at(records, now: float):
+    """Epoch at which is_recent_job() next changes for any record; None if never."""
+    edges = []
+    for j in records:
+        if j.posted_ts is None:
+            continue
+        for edge in (j.posted_ts + JOBS_MAX_AGE_DAYS * 86400, j.posted_ts - 2 * 86400):
+            if edge > now:
+                edges.append(edge)
+    return min(edges, default=None)
+
+
+def prerender_job_pages(data_source: str, image, first_page_only: bool = False):
+    """Render the unfiltered pages of one jobs image and point data_source at them."""
+    now = time.time()
+    records = image.records()
+    filtered, stale_filtered = jobs_listing(records)
+    stats = jobs_listing_stats(records, filtered)
+    if data_source == "hunter_snapshot":
+        fetched_at = image.meta.get("fetched_at") or datetime.now(timezone.utc).isoformat()
+    else:
+        fetched_at = datetime.fromtimestamp(image.meta.get("ts", 0), timezone.utc).isoformat()
+
+    name = f"{int(now * 1000):x}-{os.getpid()}-{threading.get_ident()}"
+    tmp_dir = PAGES_DIR / data_source / f".{name}.tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    pages = {}
+    for page_size in JOBS_PRERENDER_PAGE_SIZES:
+        total_pages = max(1, (len(filtered) + page_size - 1) // page_size)
+        pages[str(page_size)] = 1 if first_page_only else total_pages
+        for page in range(1, pages[str(page_size)] + 1):
+            for fmt in JOBS_PRERENDER_FORMATS:
+                result = jobs_result(records, filtered, page, page_size, fmt, data_source == "hunter_snapshot",
+                                     data_source == "market_apis", fetched_at, stale_filtered, stats)
+                body = app.json.response(result).get_data()  # same bytes as cors_response()
+                path = tmp_dir / f"{fmt}-{page_size}-{page}.json"
+                path.write_bytes(body)
+                path.with_name(path.name + ".gz").write_bytes(gzip.compress(body, compresslevel=6, mtime=0))
+    try:
+        st = os.stat(JOBS_SNAPSHOT_IMAGE if data_source == "hunter_snapshot" else JOBS_CACHE_IMAGE)
+        current = (st.st_ino, st.st_mtime_ns, st.st_size) == image.stamp
+    except FileNotFoundError:
+        current = False
+    if not current:
+        # A newer image was written while this one rendered; its own render wins.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return
+    os.replace(tmp_dir, PAGES_DIR / data_source / name)
+    write_json_atomic(PAGES_DIR / f"{data_source}.json", {
+        "dir":         f"{data_source}/{name}",
+        "stamp":       list(image.stamp),
+        "pages":       pages,
+        "complete":    not first_page_only,
+        "rendered_at": now,
+        "expires_at":  listing_expires_at(records, now),
+    })
+
+    renders = sorted((PAGES_DIR / data_source).iterdir(), key=lambda d: d.stat().st_mtime, reverse=True)
+    finished = [d for d in renders if not d.name.startswith(".")]
+    abandoned = [d for d in renders if d.name.startswith(".") and now - d.stat().st_mtime > 3600]
+    for old in finished[JOBS_PAGES_KEPT:] + abandoned:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def publish_job_pages(data_source: str, image):
+    """Render the first page inline and queue the remaining pages on a background thread."""
+    prerender_job_pages(data_source, image, first_page_only=True)
+    start_background_refresh(f"pages-{data_source}", lambda: prerender_job_pages(data_source, image))
+
+
+def prerendered_job_page(data_source: str, image, fmt: str, page_size: int, page: int):
+    """Path of the pre-rendered page for an unfiltered request, else None (re-render queued if stale)."""
+    if image is None or page_size not in JOBS_PRERENDER_PAGE_SIZES:
+        return None
+    pointer = read_json_cached(PAGES_DIR / f"{data_source}.json")
+    current = (isinstance(pointer, dict) and pointer.get("stamp") == list(image.stamp)
+               and (pointer.get("expires_at") is None or time.time() < pointer["expires_at"]))
+    if not current:
+        start_background_refresh(f"pages-{data_source}", lambda: prerender_job_pages(data_source, image))
+        return None
+    if page > pointer["pages"].get(str(page_size), 0):
+        if not pointer.get("complete", True):
+            # The background render was coalesced away or is still running.
+            start_background_refresh(f"pages-{data_source}", lambda: prerender_job_pages(data_source, image))
+        return None
+    return PAGES_DIR / pointer["dir"] / f"{'columnar' if fmt == 'columnar' else 'json'}-{page_size}-{page}.json"
+
+
+def prerendered_response(path: Path):
+    """Serve a pre-rendered page's bytes (or hand the file to nginx); None if it was pruned."""
+    if JOBS_PAGES_ACCEL_PREFIX:
+        if not path.exists():
+            return None
+        resp = cors_raw_response(b"")
+        resp.headers["X-Accel-Redirect"] = JOBS_PAGES_ACCEL_PREFIX + path.relative_to(PAGES_DIR).as_posix()
+        return resp
+    gzipped = "gzip" in request.headers.get("Accept-Encoding", "").lower()
+    try:
+        body = (path.with_name(path.name + ".gz") if gzipped else path).read_bytes()
+    except FileNotFoundError:
+        return None
+    resp = cors_raw_response(body)
+    resp.headers["Vary"] = "Accept-Encoding"
+    if gzipped:
+        resp.headers["Content-Encoding"] = "gzip"
+    return resp
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  FLASK ROUTES
 # ══════════════════════════════════════════════════════════════════════════════
@@ -588,105 +2497,106 @@ def merge_update(current: dict, payload: dict) -> dict:
 def api_options(path):
     resp = app.make_response("")
     resp.headers["Access-Control-Allow-Origin"] = "*"
-    resp.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
+    resp.headers["Access-Control-Allow-Methods"] = "GET, POST, DELETE, OPTIONS"
     resp.headers["Access-Control-Allow-Headers"] = "Authorization, Content-Type"
     return resp, 200
 
 
 # ── GET /api/jobs.py ───────────────────────────────────────────────────────────
-@app.route("/api/jobs.py", methods=["GET"])
-def api_jobs():
-    query    = request.args.get("query", "").strip()
-    location = request.args.get("location", "").strip()
-    job_type = request.args.get("type", "all")
-    page     = parse_positive_int(request.args.get("page", "1"))
-    force    = request.args.get("force", "0") == "1"
-    page_size = 20
-
-    # Prefer Hunter-provided snapshot unless force refresh is requested
-    all_jobs      = []
-    from_cache    = False
-    from_snapshot = False
-    fetched_at    = datetime.now(timezone.utc).isoformat()
+def serving_image():
+    """
+    (data_source, image) for what /api/jobs.py can serve without an upstream
+    fetch: a fresh Hunter snapshot, else the jobs cache within CACHE_TTL.
+    (None, None) when neither is usable.
+    """
+    try:
+        image = load_snapshot_image()
+        if image is not None and len(image) and is_snapshot_fresh(image.meta.get("updated_at")):
+            return "hunter_snapshot", image
+    except Exception:
+        pass
+    try:
+        image = load_cache_image()
+        if image is not None and time.time() - image.meta.get("ts", 0) < CACHE_TTL:
+            return "market_apis", image
+    except Exception:
+        pass
+    return None, None
 
-    if not force:
-        try:
-            current_data = load_current_data()
-            snapshot = current_data.get("jobs_snapshot", {})
-            snapshot_jobs = snapshot.get("jobs", []) if isinstance(snapshot, dict) else []
-            snapshot_updated_at = snapshot.get("updated_at")
-            snapshot_age_ok = False
-            if snapshot_updated_at:
-                try:
-                    su = datetime.fromisoformat(snapshot_updated_at)
-                    if su.tzinfo is None:
-                        su = su.replace(tzinfo=timezone.utc)
-                    snapshot_age_ok = (datetime.now(timezone.utc) - su).total_seconds() <= JOBS_SNAPSHOT_MAX_AGE_SECONDS
-                except Exception:
-                    snapshot_age_ok = False
-
-            if snapshot_jobs and snapshot_age_ok:
-                all_jobs = [normalize_ingested_job(j) for j in snapshot_jobs]
-                all_jobs = [j for j in all_jobs if j.get("title") and j.get("url")]
-                from_snapshot = True
-                fetched_at = snapshot.get("fetched_at") or fetched_at
-        except Exception:
-            pass
 
-    # Fallback to local cache of upstream market APIs
-    if not all_jobs and not force and JOBS_CACHE_FILE.exists():
-        try:
-            cache = json.loads(JOBS_CACHE_FILE.read_text())
-            if time.time() - cache.get("ts", 0) < CACHE_TTL:
-                all_jobs   = cache.get("all_jobs", [])
-                from_cache = True
-        except Exception:
-            pass
-
-    if not all_jobs:
-        logger.info("Fetching fresh jobs from APIs")
-        all_jobs = fetch_remotive(query) + fetch_remoteok() + fetch_arbeitnow()
-        try:
-            JOBS_CACHE_FILE.write_text(json.dumps({"all_jobs": all_jobs, "ts": time.time()}))
-        except Exception:
-            pass
+def current_jobs():
+    """(records, from_snapshot, from_cache, fetched_at) for serving_image(), or None."""
+    data_source, image = serving_image()
+    if image is None:
+        return None
+    if data_source == "hunter_snapshot":
+        fetched_at = image.meta.get("fetched_at") or datetime.now(timezone.utc).isoformat()
+        return image.records(), True, False, fetched_at
+    return image.records(), False, True, datetime.fromtimestamp(image.meta.get("ts", 0), timezone.utc).isoformat()
+
+
+def jobs_listing(records, query="", job_type="", place=None,
+                 salary_min=0, salary_max=0, currency="", sort="", sources=()):
+    """(positions, stale_filtered): every job /api/jobs.py lists for these filters, in order."""
+    # Salary, location and source filters / salary sort come from indexes, not a scan.
+    selected = None
+    if salary_min or salary_max or currency or sort == "salary":
+        index = salary_index(records)
+        if salary_min or salary_max or currency:
+            selected = index.select(salary_min, salary_max, currency or SALARY_DEFAULT_CURRENCY)
+    if place:
+        matched = location_index(records).select(**place)
+        selected = matched if selected is None else selected & matched
+    if sources:
+        matched = source_index(records).select(sources)
+        selected = matched if selected is None else selected & matched
+    positions = sorted(selected) if selected is not None else range(len(records))
 
     # Freshness filter
-    pre_fresh_count = len(all_jobs)
-    all_jobs = [j for j in all_jobs if is_recent_job(j)]
-    stale_filtered = max(0, pre_fresh_count - len(all_jobs))
+    fresh = [p for p in positions if is_recent_job(records[p])]
+    stale_filtered = max(0, len(positions) - len(fresh))
 
     # Relevance/query filters
-    filtered = filter_jobs(all_jobs, query, location, job_type)
+    filtered = filter_jobs(records, fresh, query, job_type)
+    if sort == "salary":
+        # Highest annual max first within the currency; other currencies and
+        # jobs without a parsed salary follow in listing order.
+        keep = set(filtered)
+        ranked = [p for p in index.by_salary_desc(currency or SALARY_DEFAULT_CURRENCY) if p in keep]
+        first = set(ranked)
+        filtered = ranked + [p for p in filtered if p not in first]
+    return filtered, stale_filtered
+
+
+def jobs_listing_stats(records, positions) -> dict:
+    """Counts and facets over the whole listing (the same for every page), from posting lists."""
+    selected = set(positions)
+    sources = source_index(records)
+    tags = tag_index(records)
+    places = location_index(records)
+    source_counts = {name: len(posting & selected) for name, posting in sources.names.items()}
+    tag_counts = {t: len(posting & selected) for t, posting in tags.postings.items()}
+    remote_count = len(places.remote_text & selected)
+    top_tags = sorted(((t, n) for t, n in tag_counts.items() if n), key=lambda x: -x[1])[:12]
+    return {
+        "source_counts": {name: n for name, n in source_counts.items() if n},
+        "remote_count":  remote_count,
+        "onsite_count":  len(selected) - remote_count,
+        "top_tags":      [t[0] for t in top_tags],
+        "location_facets": places.facet_counts(selected),
+    }
 
-    # Pagination
-    start     = (page - 1) * page_size
-    end       = start + page_size
-    page_jobs = filtered[start:end]
-
-    # Stats
-    source_counts = {}
-    remote_count  = 0
-    tag_counts    = {}
-    for j in filtered:
-        src = j.get("source", "Unknown")
-        source_counts[src] = source_counts.get(src, 0) + 1
-        if "remote" in j.get("type", "").lower() or "remote" in j.get("location", "").lower():
-            remote_count += 1
-        for t in j.get("tags", []):
-            tag_counts[t] = tag_counts.get(t, 0) + 1
-    top_tags = sorted(tag_counts.items(), key=lambda x: -x[1])[:12]
 
+def jobs_result(records, positions, page, page_size, fmt, from_snapshot, from_cache, fetched_at,
+                stale_filtered, stats=None) -> dict:
+    """One /api/jobs.py response body; pass stats to reuse them across pages."""
+    start     = (page - 1) * page_size
+    page_jobs = [records[p] for p in positions[start:start + page_size]]
     result = {
-        "jobs":          page_jobs,
-        "total":         len(filtered),
+        "total":         len(positions),
         "page":          page,
         "page_size":     page_size,
-        "total_pages":   (len(filtered) + page_size - 1) // page_size,
-        "source_counts": source_counts,
-        "remote_count":  remote_count,
-        "onsite_count":  len(filtered) - remote_count,
-        "top_tags":      [t[0] for t in top_tags],
+        "total_pages":   (len(positions) + page_size - 1) // page_size,
         "from_cache":    from_cache,
         "from_snapshot": from_snapshot,
         "data_source":   "hunter_snapshot" if from_snapshot else "market_apis",
@@ -694,7 +2604,115 @@ def api_jobs():
         "max_age_days":  JOBS_MAX_AGE_DAYS,
         "stale_filtered": stale_filtered,
     }
-    return cors_response(result)
+    result.update(stats if stats is not None else jobs_listing_stats(records, positions))
+    if fmt == "columnar":
+        result.update(encode_columnar(page_jobs))
+    else:
+        result["jobs"] = [j.to_dict() for j in page_jobs]
+    return result
+
+
+@app.route("/api/jobs.py", methods=["GET"])
+def api_jobs():
+    query    = request.args.get("query", "").strip()
+    location = request.args.get("location", "").strip()
+    job_type = request.args.get("type", "all")
+    page     = parse_positive_int(request.args.get("page", "1"))
+    force    = request.args.get("force", "0") == "1"
+    fmt      = request.args.get("format", "")
+    page_size = parse_positive_int(request.args.get("page_size", "20"), default=20, max_value=100)
+    salary_min = parse_positive_int(request.args.get("salary_min"), default=0, max_value=SALARY_ANNUAL_BOUNDS[1])
+    salary_max = parse_positive_int(request.args.get("salary_max"), default=0, max_value=SALARY_ANNUAL_BOUNDS[1])
+    currency   = request.args.get("currency", "").strip().upper()[:3]
+    sort       = request.args.get("sort", "")
+    # source=Remotive,Greenhouse:stripe — a bare family matches all its boards.
+    sources    = [n for n in request.args.get("source", "").split(",") if n.strip() and n.strip().lower() != "all"]
+
+    # Location filters resolve to canonical facets; location= falls back to a
+    # whole-token match on the raw location when the gazetteer doesn't know it.
+    place = location_constraints(location)
+    for facet in ("country", "region"):
+        value = request.args.get(facet, "").strip()
+        if value:
+            resolved = resolve_location_query(value, country_codes=facet == "country") or {}
+            if facet not in resolved:
+                return cors_response({"ok": False, "error": f"unknown {facet} {value!r}"}, 400)
+            place[facet] = resolved[facet]
+    remote = request.args.get("remote", "").strip().lower()
+    if remote:
+        if remote not in REMOTE_SCOPES and remote != "any":
+            return cors_response({"ok": False, "error": f"'remote' must be 'any' or one of {list(REMOTE_SCOPES)}"}, 400)
+        place["remote"] = REMOTE_ANY if remote == "any" else (remote,)
+
+    # Unfiltered listing: serve the page rendered at ingest as-is.
+    if not (force or query or place or sources or salary_min or salary_max or currency or sort
+            or job_type not in ("", "all")):
+        data_source, image = serving_image()
+        path = prerendered_job_page(data_source, image, fmt, page_size, page)
+        resp = prerendered_response(path) if path else None
+        if resp is not None:
+            return resp
+
+    flags = {}
+    if force:
+        # force=1 asks for market API data: serve the jobs cache at any age and
+        # refresh it in the background (coalesced + rate limited), never inline.
+        cache = load_cache_image()
+        cache_age = time.time() - cache.meta.get("ts", 0) if cache is not None else None
+        flags = forced_refresh("jobs", cache_age, refresh_jobs_cache)
+        if cache is None:
+            status = 429 if flags["refresh"] == "throttled" else 202
+            return refresh_response({"ok": status == 202, "total": 0, "jobs": []}, flags, status)
+        source = (cache.records(), False, True, datetime.fromtimestamp(cache.meta.get("ts", 0), timezone.utc).isoformat())
+    else:
+        source = current_jobs()
+        if source is None:
+            # Cold: one worker fetches, concurrent cold requests wait and reuse it.
+            with refresh_lock("jobs"):
+                source = current_jobs()
+                if source is None:
+                    source = (refresh_jobs_cache(), False, False, datetime.now(timezone.utc).isoformat())
+    all_jobs, from_snapshot, from_cache, fetched_at = source
+
+    filtered, stale_filtered = jobs_listing(all_jobs, query, job_type, place,
+                                            salary_min, salary_max, currency, sort, sources)
+    result = jobs_result(all_jobs, filtered, page, page_size, fmt, from_snapshot, from_cache, fetched_at,
+                         stale_filtered)
+    if salary_min or salary_max or currency or sort == "salary":
+        result["salary_currency"] = currency or SALARY_DEFAULT_CURRENCY
+    result.update(flags)
+    return refresh_response(result, flags)
+
+
+# ── GET /api/job.py — full job detail (snippet) by id ─────────────────────────
+JOB_DETAIL_MAX_IDS = 100
+
+
+@app.route("/api/job.py", methods=["GET"])
+def api_job_detail():
+    ids = [i.strip() for i in request.args.get("id", "").split(",") if i.strip()]
+    if not ids:
+        return cors_response({"ok": False, "error": "'id' is required"}, 400)
+    ids = ids[:JOB_DETAIL_MAX_IDS]
+
+    # Look up in whatever is materialized; never triggers an upstream fetch.
+    found = {}
+    for image in (load_snapshot_image(), load_cache_image()):
+        if image is None:
+            continue
+        for i in ids:
+            if i not in found:
+                job = image.find(i)
+                if job is not None:
+                    found[i] = job.to_dict()
+
+    resp = cors_response({
+        "ok":      True,
+        "jobs":    found,
+        "missing": [i for i in ids if i not in found],
+    })
+    resp.headers["Cache-Control"] = "public, max-age=300"
+    return resp
 
 
 # ── GET /api/news.py ───────────────────────────────────────────────────────────
@@ -702,68 +2720,362 @@ def api_jobs():
 def api_news():
     force = request.args.get("force", "0") == "1"
 
-    # Try cache first
-    if not force:
+    if force:
+        # Serve the cache at any age; refresh in the background (coalesced + rate limited).
+        cache = read_json_cached(NEWS_CACHE_FILE)
+        cache = cache if isinstance(cache, dict) else None
+        cache_age = time.time() - cache.get("ts", 0) if cache else None
+        flags = forced_refresh("news", cache_age, refresh_news_cache)
+        if cache is None:
+            status = 429 if flags["refresh"] == "throttled" else 202
+            return refresh_response({"ok": status == 202, "news": [], "total": 0}, flags, status)
+        return refresh_response(dict(cache, from_cache=True), flags)
+
+    cached = get_news_cached()
+    if cached:
+        return cors_response(dict(cached, from_cache=True))
+
+    # Cold: one worker fetches, concurrent cold requests wait and reuse it.
+    with refresh_lock("news"):
         cached = get_news_cached()
         if cached:
-            cached["from_cache"] = True
-            return cors_response(cached)
+            return cors_response(dict(cached, from_cache=True))
+        return cors_response(refresh_news_cache())
 
-    # Fetch fresh
-    logger.info("Fetching fresh news from RSS feeds")
-    all_items = []
-    for name, url in RSS_FEEDS.items():
-        all_items.extend(fetch_rss(url, name))
 
-    # Deduplicate by title similarity
-    seen   = set()
-    unique = []
-    for item in all_items:
-        key = item["title"][:50].lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append(item)
+# ── GET /api/trends.py — rollup time series for charts ─────────────────────────
+def rollup_point(bucket: dict, dimension: str, name: str):
+    """Count of `name` in one bucket; None when it fell outside a truncated tag list."""
+    counts = bucket.get(dimension, {})
+    if name in counts:
+        return counts[name]
+    if dimension == "tags" and bucket.get("tags_truncated", len(counts) >= ROLLUP_MAX_TAGS):
+        return None
+    return 0
+
+
+@app.route("/api/trends.py", methods=["GET"])
+def api_trends():
+    granularity = request.args.get("granularity", "daily")
+    dimension   = request.args.get("dimension", "tags")
+    limit       = parse_positive_int(request.args.get("limit", "8"), default=8, max_value=ROLLUP_MAX_TAGS)
+    if granularity not in ROLLUP_RETENTION:
+        return cors_response({"ok": False, "error": f"'granularity' must be one of {sorted(ROLLUP_RETENTION)}"}, 400)
+    if dimension not in ROLLUP_DIMENSIONS:
+        return cors_response({"ok": False, "error": f"'dimension' must be one of {list(ROLLUP_DIMENSIONS)}"}, 400)
+
+    rollups = read_json_cached(ROLLUPS_FILE, {})
+    data_source = request.args.get("data_source", "")
+    if data_source not in rollups:
+        # Default to whichever data source was observed most recently.
+        latest = {
+            src: max((b.get("observed_at", "") for b in series.get(granularity, {}).values()), default="")
+            for src, series in rollups.items()
+        }
+        data_source = max(latest, key=latest.get) if latest else None
 
-    result = {
-        "news":       unique[:30],
-        "total":      len(unique),
-        "sources":    list(RSS_FEEDS.keys()),
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
-        "ts":         time.time(),
-        "from_cache": False,
-    }
+    buckets = rollups.get(data_source, {}).get(granularity, {}) if data_source else {}
+    keys = sorted(buckets)
 
-    # Save cache
+    if dimension == "remote":
+        names = ["remote", "onsite"]
+        series = {n: [buckets[k].get(n, 0) for k in keys] for n in names}
+    else:
+        latest_counts = buckets[keys[-1]].get(dimension, {}) if keys else {}
+        names = [n for n, _ in sorted(latest_counts.items(), key=lambda x: -x[1])[:limit]]
+        series = {n: [rollup_point(buckets[k], dimension, n) for k in keys] for n in names}
+
+    return cors_response({
+        "ok":          True,
+        "granularity": granularity,
+        "dimension":   dimension,
+        "data_source": data_source,
+        "buckets":     keys,
+        "totals":      [buckets[k].get("total", 0) for k in keys],
+        "series":      series,
+    })
+
+
+# ── GET /api/stats.py — precomputed summary for monitoring ────────────────────
+def _jobs_cache_state(name: str, entry: dict) -> str:
+    if not entry:
+        return "missing"
+    if name == "hunter_snapshot":
+        return "fresh" if entry.get("raw") and is_snapshot_fresh(entry.get("updated_at")) else "stale"
+    return "fresh" if time.time() - entry.get("ts", 0) < CACHE_TTL else "stale"
+
+
+@app.route("/api/stats.py", methods=["GET"])
+def api_stats():
+    # Reads stats.json only; never filters jobs or fetches upstream.
+    if not STATS_FILE.exists():
+        rebuild_stats()
+    stats = read_json_cached(STATS_FILE, {})
+    now = time.time()
+
+    jobs_stats = stats.get("jobs", {})
+    caches = {}
+    for name in ("hunter_snapshot", "market_apis"):
+        entry = jobs_stats.get(name)
+        age = None
+        if entry:
+            age = (age_seconds_since(entry.get("updated_at")) if name == "hunter_snapshot"
+                   else int(now - entry["ts"]) if entry.get("ts") else None)
+        caches[name] = {
+            "state":       _jobs_cache_state(name, entry),
+            "raw":         (entry or {}).get("raw", 0),
+            "total":       (entry or {}).get("total", 0),
+            "age_seconds": age,
+        }
+    # Same precedence as /api/jobs.py; None means the next request refetches upstream.
+    serving = next((n for n in ("hunter_snapshot", "market_apis") if caches[n]["state"] == "fresh"), None)
+    shown = serving or next((n for n in ("hunter_snapshot", "market_apis") if jobs_stats.get(n)), None)
+    entry = jobs_stats.get(shown, {}) if shown else {}
+
+    news = stats.get("news") or {}
+    news_age = int(now - news["ts"]) if news.get("ts") else None
+    dashboard = stats.get("dashboard") or {}
+
+    return cors_response({
+        "ok":           True,
+        "generated_at": stats.get("generated_at"),
+        "jobs": {
+            "serving":       serving,
+            "from_snapshot": serving == "hunter_snapshot",
+            "from_cache":    serving == "market_apis",
+            "total":         entry.get("total", 0),
+            "remote":        entry.get("remote", 0),
+            "onsite":        entry.get("onsite", 0),
+            "age_seconds":   caches[shown]["age_seconds"] if shown else None,
+            "sources":       entry.get("sources", {}),
+            "locations":     entry.get("locations", {}),
+            "top_tags":      entry.get("top_tags", []),
+            "salary_histogram": entry.get("salary_histogram"),
+            "caches":        caches,
+        },
+        "news": {
+            "total":       news.get("total", 0),
+            "from_cache":  news_age is not None and news_age < CACHE_TTL,
+            "state":       "missing" if news_age is None else "fresh" if news_age < CACHE_TTL else "stale",
+            "age_seconds": news_age,
+        },
+        "dashboard": dict(dashboard, age_seconds=age_seconds_since(dashboard.get("last_updated"))),
+    })
+
+
+# ── GET /api/events.py — server-sent change notices ───────────────────────────
+@app.route("/api/events.py", methods=["GET"])
+def api_events():
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("since")
     try:
-        NEWS_CACHE_FILE.write_text(json.dumps(result))
-    except Exception:
-        pass
+        last_version = int(last_event_id) if last_event_id is not None else None
+    except ValueError:
+        last_version = None
+
+    if not _sse_slots.acquire(blocking=False):
+        resp = cors_response({"ok": False, "error": "Too many live streams; poll instead"}, 503)
+        resp.headers["Retry-After"] = str(SSE_RETRY_AFTER)
+        return resp
+
+    sock = request.environ.get("gunicorn.socket")
+
+    def stream():
+        nonlocal last_version
+        yield "retry: 3000\n\n"
+        started = last_beat = time.time()
+        stamp = None
+        while time.time() - started < SSE_MAX_STREAM_SECONDS:
+            if client_disconnected(sock):
+                return
+            try:
+                st = os.stat(CHANGES_FILE)
+                current_stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                current_stamp = None
+            if current_stamp is not None and current_stamp != stamp:
+                stamp = current_stamp
+                changes = read_json_cached(CHANGES_FILE)
+                if isinstance(changes, dict):
+                    if last_version is None:
+                        # Fresh subscriber: announce the baseline, nothing to refetch.
+                        hello = {"version": changes["version"], "etags": changes.get("etags", {})}
+                        yield f"id: {changes['version']}\nevent: hello\ndata: {json.dumps(hello)}\n\n"
+                        last_version = changes["version"]
+                    elif changes["version"] != last_version:
+                        notice = change_notice_since(changes, last_version)
+                        yield f"id: {notice['version']}\nevent: change\ndata: {json.dumps(notice)}\n\n"
+                        last_version = notice["version"]
+            if time.time() - last_beat >= SSE_HEARTBEAT_SECONDS:
+                yield ": ping\n\n"
+                last_beat = time.time()
+            time.sleep(SSE_POLL_SECONDS)
+
+    resp = cors_raw_response(stream(), content_type="text/event-stream")
+    resp.call_on_close(_sse_slots.release)  # runs on completion and on client disconnect
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"  # stream through nginx unbuffered
+    return resp
+
+
+# ── /api/searches.py — saved searches (Bearer auth) ──────────────────────────
+SAVED_SEARCH_MAX_BODY = 4096
 
+
+def unauthorized_response():
+    return cors_response({
+        "ok":    False,
+        "error": "Unauthorized — invalid or missing Bearer token",
+        "hint":  "Set Authorization: Bearer <DASHBOARD_UPDATE_TOKEN> header",
+    }, 401)
+
+
+def saved_search_summary(search: dict, data_source, image) -> dict:
+    rows = saved_search_view(search, data_source, image)
+    return dict(search, total=len(rows), new_count=sum(1 for row in rows if row[2]))
+
+
+@app.route("/api/searches.py", methods=["GET", "POST", "DELETE"])
+def api_searches():
+    if not validate_bearer(get_auth_token()):
+        return unauthorized_response()
+    search_id = request.args.get("id", "").strip()
+
+    if request.method == "POST":
+        if (request.content_length or 0) > SAVED_SEARCH_MAX_BODY:
+            return cors_response({"ok": False, "error": "Request body too large"}, 413)
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict):
+            return cors_response({"ok": False, "error": "Payload must be a JSON object"}, 400)
+        search = {}
+        for field, limit in SAVED_SEARCH_LIMITS.items():
+            value = payload.get(field, "")
+            if not isinstance(value, str) or len(value.strip()) > limit:
+                return cors_response({"ok": False, "error": f"'{field}' must be a string of at most {limit} chars"}, 400)
+            search[field] = value.strip()
+        search["type"] = search["type"].lower()
+        if search["type"] not in ("", "all", "remote"):
+            return cors_response({"ok": False, "error": "'type' must be 'all' or 'remote'"}, 400)
+        if not (search["query"] or location_constraints(search["location"]) or search["type"] == "remote"):
+            return cors_response({"ok": False, "error": "a saved search needs a query, location or type=remote"}, 400)
+        search["name"] = search["name"] or search["query"] or search["location"] or "Remote"
+        with file_lock("searches"):
+            doc = load_saved_searches()
+            if len(doc["searches"]) >= SAVED_SEARCHES_MAX:
+                return cors_response({"ok": False, "error": f"at most {SAVED_SEARCHES_MAX} saved searches"}, 409)
+            search.update(id=os.urandom(6).hex(), created_at=datetime.now(timezone.utc).isoformat(),
+                          last_viewed_at=None)
+            doc["searches"][search["id"]] = search
+            write_json_atomic(SAVED_SEARCHES_FILE, doc)
+        percolate_new_search(search)
+        data_source, image = serving_image()
+        return cors_response({"ok": True, "search": saved_search_summary(search, data_source, image)}, 201)
+
+    if request.method == "DELETE":
+        if not search_id:
+            return cors_response({"ok": False, "error": "'id' is required"}, 400)
+        with file_lock("searches"):
+            doc = load_saved_searches()
+            if doc["searches"].pop(search_id, None) is None:
+                return cors_response({"ok": False, "error": "saved search not found"}, 404)
+            write_json_atomic(SAVED_SEARCHES_FILE, doc)
+            results = load_saved_search_results()
+            if results["results"].pop(search_id, None) is not None:
+                write_json_atomic(SAVED_SEARCH_RESULTS_FILE, results)
+        return cors_response({"ok": True, "deleted": search_id})
+
+    # GET: precomputed results only; never filters the full job set.
+    searches = (read_json_cached(SAVED_SEARCHES_FILE, {}) or {}).get("searches", {})
+    data_source, image = serving_image()
+    if not search_id:
+        return cors_response({
+            "ok":          True,
+            "data_source": data_source,
+            "searches":    [saved_search_summary(sr, data_source, image) for sr in searches.values()],
+        })
+    search = searches.get(search_id)
+    if search is None:
+        return cors_response({"ok": False, "error": "saved search not found"}, 404)
+
+    rows = saved_search_view(search, data_source, image)
+    page = parse_positive_int(request.args.get("page", "1"))
+    page_size = parse_positive_int(request.args.get("page_size", "20"), default=20, max_value=100)
+    result = paginate(rows, page, page_size)
+    result.update({
+        "ok":          True,
+        "search":      search,
+        "data_source": data_source,
+        "new_count":   sum(1 for row in rows if row[2]),
+        "jobs":        [dict(j.to_dict(), first_seen=ts, new=is_new) for j, ts, is_new in result.pop("items")],
+    })
+    if request.args.get("mark_seen", "1") != "0":
+        # Seen up to the newest match returned, so a concurrent ingest's matches stay new.
+        seen_up_to = max((ts for _, ts, _ in rows), default=datetime.now(timezone.utc).isoformat())
+        with file_lock("searches"):
+            doc = load_saved_searches()
+            if search_id in doc["searches"]:
+                doc["searches"][search_id]["last_viewed_at"] = seen_up_to
+                write_json_atomic(SAVED_SEARCHES_FILE, doc)
     return cors_response(result)
 
 
 # ── GET /api/update.py — return current dashboard data ────────────────────────
 @app.route("/api/update.py", methods=["GET"])
 def api_update_get():
-    data = load_current_data()
+    data = dashboard_document()
+
+    # ?fields=meta,kpi_updates projects the document to just those sections.
+    fields = request.args.get("fields", "").strip()
+    names = [f.strip() for f in fields.split(",") if f.strip()] if fields else list(data)
+    names = [n for n in names if n in data]
+
+    age_seconds = age_seconds_since(data.get("meta", {}).get("last_updated"))
+    parts = [json.dumps(n).encode("utf-8") + b":" + encoded_section(data, n)[0] for n in names]
+    body = (
+        b'{"ok":true,"age_seconds":' + json.dumps(age_seconds).encode("utf-8")
+        + b',"data":{' + b",".join(parts) + b"}}"
+    )
+    return cors_raw_response(body)
 
-    last_updated = data.get("meta", {}).get("last_updated")
-    age_seconds  = None
-    if last_updated:
-        try:
-            lu = datetime.fromisoformat(last_updated)
-            if lu.tzinfo is None:
-                lu = lu.replace(tzinfo=timezone.utc)
-            now = datetime.now(timezone.utc)
-            age_seconds = int((now - lu).total_seconds())
-        except Exception:
-            pass
 
-    return cors_response({
-        "ok":          True,
-        "data":        data,
-        "age_seconds": age_seconds,
+# ── GET /api/{history,alerts,insights,snapshot}.py — paginated sections ───────
+DASHBOARD_LIST_SECTIONS = {
+    "history":  "history",
+    "alerts":   "trend_alerts",
+    "insights": "new_insights",
+}
+
+
+def _section_page_args():
+    page      = parse_positive_int(request.args.get("page", "1"))
+    page_size = parse_positive_int(request.args.get("page_size", "20"), default=20, max_value=100)
+    return page, page_size
+
+
+@app.route("/api/history.py", methods=["GET"])
+@app.route("/api/alerts.py", methods=["GET"])
+@app.route("/api/insights.py", methods=["GET"])
+def api_dashboard_section():
+    name = request.path.rsplit("/", 1)[-1][:-len(".py")]
+    items = dashboard_document().get(DASHBOARD_LIST_SECTIONS[name], [])
+    if name == "history":
+        items = items[::-1]  # stored oldest-first; serve newest-first like alerts/insights
+    page, page_size = _section_page_args()
+    return cors_response(dict(paginate(items, page, page_size), ok=True))
+
+
+@app.route("/api/snapshot.py", methods=["GET"])
+def api_snapshot():
+    snapshot = dashboard_document().get("jobs_snapshot") or {}
+    page, page_size = _section_page_args()
+    result = paginate(snapshot.get("jobs", []), page, page_size)
+    result.update({
+        "ok":         True,
+        "fetched_at": snapshot.get("fetched_at"),
+        "updated_at": snapshot.get("updated_at"),
+        "source":     snapshot.get("source"),
+        "sources":    snapshot.get("sources", []),
     })
+    return cors_response(result)
 
 
 # ── POST /api/update.py — push new market intelligence data ───────────────────
@@ -772,11 +3084,7 @@ def api_update_post():
     # Validate auth
     expected_token = get_auth_token()
     if not validate_bearer(expected_token):
-        return cors_response({
-            "ok":    False,
-            "error": "Unauthorized — invalid or missing Bearer token",
-            "hint":  "Set Authorization: Bearer <DASHBOARD_UPDATE_TOKEN> header",
-        }, 401)
+        return unauthorized_response()
 
     # Read body (honour Content-Length; fall back to reading up to MAX_BODY_SIZE)
     content_length_str = request.headers.get("Content-Length", "0")
@@ -792,6 +3100,26 @@ def api_update_post():
     if len(raw_body) > MAX_BODY_SIZE:
         return cors_response({"ok": False, "error": "Request body too large"}, 413)
 
+    # Optional gzip request body. Inflate at most MAX_BODY_SIZE + 1 bytes so a
+    # small compressed body can't expand into an arbitrarily large one.
+    content_encoding = request.headers.get("Content-Encoding", "identity").strip().lower()
+    if content_encoding == "gzip":
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            raw_body = inflater.decompress(raw_body, MAX_BODY_SIZE + 1)
+        except zlib.error as e:
+            return cors_response({"ok": False, "error": f"Invalid gzip body: {e}"}, 400)
+        if len(raw_body) > MAX_BODY_SIZE or inflater.unconsumed_tail:
+            return cors_response({"ok": False, "error": "Decompressed request body too large"}, 413)
+        if not inflater.eof:
+            return cors_response({"ok": False, "error": "Invalid gzip body: truncated stream"}, 400)
+        if inflater.unused_data:
+            # Concatenated members or trailing bytes: only the first member
+            # was inflated, so the body as sent would be silently truncated.
+            return cors_response({"ok": False, "error": "Invalid gzip body: data after end of stream"}, 400)
+    elif content_encoding not in ("", "identity"):
+        return cors_response({"ok": False, "error": f"Unsupported Content-Encoding '{content_encoding}'"}, 415)
+
     # Parse JSON payload
     try:
         payload = json.loads(raw_body.decode("utf-8"))
@@ -821,11 +3149,33 @@ def api_update_post():
         if len(jobs) > JOBS_SNAPSHOT_MAX_ITEMS:
             return cors_response({"ok": False, "error": f"'jobs_snapshot.jobs' exceeds max {JOBS_SNAPSHOT_MAX_ITEMS}"}, 400)
 
+        snapshot = payload["jobs_snapshot"]
+        if "snapshot_id" in snapshot:
+            error = validate_snapshot_batch(snapshot)
+            if error:
+                return cors_response({"ok": False, "error": error}, 400)
+            try:
+                assembled, received = stage_snapshot_batch(snapshot)
+            except (IOError, json.JSONDecodeError) as e:
+                return cors_response({"ok": False, "error": f"Failed to stage snapshot batch: {e}"}, 500)
+            if assembled is None:
+                return cors_response({
+                    "ok":               True,
+                    "staged":           True,
+                    "snapshot_id":      snapshot["snapshot_id"],
+                    "batches_received": received,
+                    "batch_count":      snapshot["batch_count"],
+                }, 202)
+            if len(assembled) > JOBS_SNAPSHOT_MAX_ITEMS:
+                return cors_response({"ok": False, "error": f"Batched snapshot exceeds max {JOBS_SNAPSHOT_MAX_ITEMS} jobs"}, 400)
+            payload["jobs_snapshot"] = dict(snapshot, jobs=assembled)
+
     # Merge and persist
     try:
-        current = load_current_data()
-        updated = merge_update(current, payload)
-        save_data(updated)
+        with file_lock("dashboard"):
+            current = load_current_data()
+            updated = merge_update(current, payload)
+            save_data(updated)
         logger.info("Dashboard data updated successfully")
     except IOError as e:
         return cors_response({"ok": False, "error": f"Failed to write data file: {e}"}, 500)
@@ -862,10 +3212,31 @@ def serve_static_fallback(filename):
 # ── Health check ──────────────────────────────────────────────────────────────
 @app.route("/health")
 def health():
-    return jsonify({"status": "ok", "ts": datetime.now(timezone.utc).isoformat()})
+    return jsonify({
+        "status":  "ok",
+        "ts":      datetime.now(timezone.utc).isoformat(),
+        "live":    True,
+        "ready":   _warmup["ready"],
+        "startup": {k: _warmup[k] for k in ("pid", "warmup_ms", "startup_ms", "warmed_at")},
+    })
+
+
+@app.route("/health/live")
+def health_live():
+    """Liveness: the process is up and serving, warmed or not."""
+    return jsonify({"status": "ok", "live": True})
+
+
+@app.route("/health/ready")
+def health_ready():
+    """Readiness: read-side structures are built; 503 until warm-up finishes."""
+    if not _warmup["ready"]:
+        return jsonify({"status": "warming", "ready": False}), 503
+    return jsonify({"status": "ok", "ready": True, "warmup_ms": _warmup["warmup_ms"]})
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     # For local dev only; production uses gunicorn
+    ensure_warm()
     app.run(host="0.0.0.0", port=5000, debug=False)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Bytes-per-job comparison: plain job dicts vs. JobRecord vs. ImageJob views.
+
+Builds a synthetic snapshot with realistic repetition (a handful of sources,
+types, locations and tags), round-trips it through JSON the way the old read
+path did, and measures each representation with tracemalloc. ImageJob is the
+per-process cost of JobsImage.records() over a mapped image (the job data
+itself lives in the shared page cache).
+
+Exits 1 when a representation exceeds its budget in BUDGETS, so a change that
+grows the per-job footprint fails loudly instead of silently.
+
+Usage:
+  python3 benchmarks/job_memory.py [job_count]
+"""
+
+import json
+import random
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import JobRecord, JobsImage, write_jobs_image  # noqa: E402
+
+BUDGETS = {"JobRecord": 900, "ImageJob": 100}  # bytes per job
+
+SOURCES   = ["Remotive", "RemoteOK", "Arbeitnow", "Hunter"] + [f"Greenhouse:{b}" for b in ("stripe", "figma", "datadog")]
+TYPES     = ["Remote", "Full-time"]
+LOCATIONS = ["Remote", "USA", "Worldwide", "Berlin, Germany", "New York, NY", "London, UK", "Remote - US"]
+TAGS      = ["python", "aws", "react", "typescript", "sql", "kubernetes", "go", "data", "ml", "devops", "java", "node"]
+SALARIES  = ["", "", "", "$120k - $150k", "$90,000 - $110,000", "$60/hr"]
+
+
+def synthetic_jobs(n: int) -> list:
+    rnd = random.Random(42)
+    jobs = []
+    for i in range(n):
+        jobs.append({
+            "title":    f"Senior Software Engineer {i}",
+            "company":  f"Company {i % 500}",
+            "location": rnd.choice(LOCATIONS),
+            "salary":   rnd.choice(SALARIES),
+            "type":     rnd.choice(TYPES),
+            "posted":   f"2026-04-{1 + i % 28:02d}T12:00:00+00:00",
+            "url":      f"https://example.com/jobs/{i}",
+            "tags":     rnd.sample(TAGS, 5),
+            "source":   rnd.choice(SOURCES),
+            "snippet":  f"Job {i}: build and operate distributed services. " * 4,
+        })
+    # Round-trip through JSON so every string is a separate object, as it was
+    # when each request parsed dashboard_data.json.
+    return json.loads(json.dumps(jobs))
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return after - before
+
+
+def main() -> int:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    payload = json.dumps(synthetic_jobs(n))
+
+    dict_bytes   = measure(lambda: json.loads(payload))
+    record_bytes = measure(lambda: [JobRecord.from_dict(j) for j in json.loads(payload)])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "jobs.bin"
+        write_jobs_image(path, json.loads(payload), {})
+        image = JobsImage(path)
+        view_bytes = measure(image.records)
+
+    print(f"jobs:            {n:,}")
+    print(f"dict bytes/job:  {dict_bytes / n:,.0f}")
+    print(f"JobRecord b/job: {record_bytes / n:,.0f}  (budget {BUDGETS['JobRecord']})")
+    print(f"ImageJob b/job:  {view_bytes / n:,.0f}  (budget {BUDGETS['ImageJob']})")
+    print(f"reduction:       {100 * (1 - record_bytes / dict_bytes):.1f}% (JobRecord), "
+          f"{100 * (1 - view_bytes / dict_bytes):.1f}% (ImageJob)")
+    over = [name for name, size in (("JobRecord", record_bytes), ("ImageJob", view_bytes))
+            if size / n > BUDGETS[name]]
+    if over:
+        print(f"over budget: {', '.join(over)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,46 @@
+"""
+Gunicorn configuration for the IT Jobs Intelligence Dashboard.
+Gunicorn loads ./gunicorn.conf.py automatically; command-line flags such as
+-w / -b in the systemd unit still take precedence over the values here.
+"""
+import gc
+
+bind = "127.0.0.1:8000"
+workers = 2
+timeout = 120
+
+# /api/events.py holds a connection open for minutes. Threaded workers keep
+# those streams from pinning a whole process (and from tripping the sync
+# worker timeout) while other requests are served. Each stream still holds
+# a thread, so app.py caps streams per worker (SSE_MAX_STREAMS_PER_WORKER,
+# default 4) below `threads`; keep that true if you lower `threads`.
+worker_class = "gthread"
+threads = 8
+
+# Import the app once in the master so every worker forks from a process that
+# already holds the parsed dashboard data, mapped jobs images and records.
+preload_app = True
+
+
+def when_ready(server):
+    # Master, after preload and before the first fork.
+    import app
+    app.ensure_warm()
+    # Move everything built so far out of the GC's tracked generations so
+    # collections in the workers don't touch (and copy) the shared pages.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import app
+    app.mark_worker_started()
+
+
+def post_worker_init(worker):
+    # Worker, before it starts accepting connections. Cheap when nothing
+    # changed since the master warmed up: every structure is keyed by file
+    # version and only rebuilt if a newer snapshot landed in between. A failed
+    # warm-up is logged and leaves /health/ready not-ready; it never stops the
+    # worker from booting.
+    import app
+    app.ensure_warm()
@@ -7,11 +7,12 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 DIR="${HOME}/.openclaw/skills/it-dashboard-manager"
 
 FILES=(
-  "SKILL.md:53d1d9fb264b8b063e5324f216860aad651ad0c2ddc9edf8fda6ec129d73b3da"
+  "SKILL.md:22af35f6e44ee667ee513409f5a8498414f42dedebf596613ceb94b57f7e2d91"
   "scripts/collect-jobs.sh:3e416f5af5410b34710c4c3fe520e60b3766e520a40143c24fa68f3ae14c55fd"
-  "scripts/collect-trends.py:e27d5a4b937375e061cf3a329909513ebb8098a9e70e1dff9d4b81d675f9c5f0"
-  "scripts/collect-jobs-agent-browser.sh:ebbc0ed4f3292b3a253866cbb5a7afc21c18d77c19a54a42163447635f21f50f"
-  "scripts/push-jobs-snapshot.py:5d5f496bcb46f053385f99f90de861a84764d5a800961c264b8e5369f8580875"
+  "scripts/collect-trends.py:5732dd9678d08d0c81c4642e5ff47b660a92b1dea55feb0714f4d02ef7c8852c"
+  "scripts/collect-jobs-agent-browser.sh:b3861d14268a19c88746ac7ff415d5d1c4cbd1c0a0d6937db6b931b9f2b635ca"
+  "scripts/hunter_collector.py:703b36a7a73a5f81304dcd3a594f37a9a44a13e2ca7bc5ef950d0359b3a038fb"
+  "scripts/push-jobs-snapshot.py:f685a4d55e3535d5ca7207acbd72468cf65b8d8b51b91d0f2062b39ee1e9c992"
 )
 
 sha256_file() {
@@ -57,6 +58,7 @@ chmod +x \
   "${DIR}/scripts/collect-jobs.sh" \
   "${DIR}/scripts/collect-trends.py" \
   "${DIR}/scripts/collect-jobs-agent-browser.sh" \
+  "${DIR}/scripts/hunter_collector.py" \
   "${DIR}/scripts/push-jobs-snapshot.py"
 
 pip3 install -q requests beautifulsoup4 2>/dev/null || true
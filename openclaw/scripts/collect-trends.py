@@ -37,20 +37,21 @@ def main() -> int:
         "source_status": {},
     }
 
-    for name, path in {
-        "jobs": "/api/jobs.py",
-        "news": "/api/news.py",
-        "update": "/api/update.py",
-    }.items():
-        try:
-            data = fetch_json(f"{DASHBOARD_URL}{path}")
+    # One small precomputed summary instead of hitting every endpoint:
+    # /api/stats.py never runs job filters or triggers upstream fetches.
+    try:
+        stats = fetch_json(f"{DASHBOARD_URL}/api/stats.py")
+        for name, section in (("jobs", "jobs"), ("news", "news"), ("update", "dashboard")):
+            data = stats.get(section) or {}
             result["source_status"][name] = {
                 "ok": True,
-                "total": data.get("total"),
+                "total": data.get("total", data.get("snapshot_jobs")),
                 "from_cache": data.get("from_cache"),
                 "age_seconds": data.get("age_seconds"),
             }
-        except (OSError, URLError, json.JSONDecodeError) as exc:
+        result["source_status"]["jobs"]["serving"] = stats.get("jobs", {}).get("serving")
+    except (OSError, URLError, json.JSONDecodeError) as exc:
+        for name in ("jobs", "news", "update"):
             result["source_status"][name] = {
                 "ok": False,
                 "error": str(exc)[:180],
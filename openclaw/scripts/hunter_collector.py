@@ -0,0 +1,747 @@
+#!/usr/bin/env python3
+"""
+hunter_collector.py
+Diversified targeted job collector for Hunter.
+
+Sources (diversified):
+- Greenhouse board APIs (curated company list)
+- Lever posting APIs (curated company list)
+- Remotive / RemoteOK / Arbeitnow APIs (when USE_AGGREGATOR_SOURCES=1)
+
+Every board / feed is an independent fetch task. Tasks run on a thread pool
+per host (so one slow API can't starve the others), a shared cap bounds total
+in-flight requests, and an overall deadline bounds the run, so a run takes
+roughly as long as its slowest board instead of the sum of all of them. A per-task timing report is included in the output as `fetch_report`
+and summarized on stderr.
+
+Runs are incremental: a JSON state file (HUNTER_STATE_FILE, default
+./.hunter_state.json) keeps a fingerprint per posting and an updated_at
+high-water mark per board, so unchanged postings skip clean_html and target
+matching. By default the output is still the full job list (what
+push-jobs-snapshot.py expects); `--incremental` emits only new and changed
+jobs. Both include `removed` and a `changes` summary.
+
+Usage:
+  python3 hunter_collector.py [--target-only] [--incremental] > /tmp/jobs_raw.json
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+# -----------------------------------------------------------------------------
+# Tunables
+# -----------------------------------------------------------------------------
+MAX_AGE_DAYS = int(os.environ.get("JOBS_COLLECT_MAX_AGE_DAYS", "10"))
+PER_SOURCE_LIMIT = int(os.environ.get("JOBS_PER_SOURCE_LIMIT", "60"))
+PER_GREENHOUSE_BOARD_LIMIT = int(os.environ.get("JOBS_PER_GREENHOUSE_BOARD_LIMIT", "15"))
+USE_AGENT_BROWSER_REMOTEOK = os.environ.get("USE_AGENT_BROWSER_REMOTEOK", "0") == "1"
+USE_AGGREGATOR_SOURCES = os.environ.get("USE_AGGREGATOR_SOURCES", "0") == "1"
+
+FETCH_TIMEOUT = float(os.environ.get("JOBS_FETCH_TIMEOUT", "20"))
+MAX_WORKERS = int(os.environ.get("JOBS_COLLECT_MAX_WORKERS", "12"))
+PER_HOST_LIMIT = int(os.environ.get("JOBS_COLLECT_PER_HOST_LIMIT", "4"))
+# Greenhouse / Lever serve every board from one host, so they get a somewhat
+# higher cap than other hosts to keep the board list moving, but still a real
+# cap below the pool. Raise JOBS_COLLECT_ATS_HOST_LIMIT (up to MAX_WORKERS) to
+# trade politeness for speed.
+ATS_HOST_LIMIT = int(os.environ.get("JOBS_COLLECT_ATS_HOST_LIMIT", "6"))
+HOST_LIMITS = {"boards-api.greenhouse.io": ATS_HOST_LIMIT, "api.lever.co": ATS_HOST_LIMIT}
+RUN_DEADLINE_SECONDS = float(os.environ.get("JOBS_COLLECT_DEADLINE", "90"))
+
+DEFAULT_GREENHOUSE_BOARDS = [
+    "stripe",
+    "airtable",
+    "datadog",
+    "cloudflare",
+    "anthropic",
+    "figma",
+    "coinbase",
+    "roblox",
+    "amazon",
+    "microsoft",
+    "google",
+    "meta",
+    "apple",
+    "nvidia",
+    "tesla",
+    "netflix",
+    "uber",
+    "lyft",
+    "spotify",
+    "snap",
+    "pinterest",
+    "reddit",
+    "snapchat",
+    "twitter",
+    "discord",
+    "twitch",
+]
+
+# Lever boards (different from Greenhouse)
+DEFAULT_LEVER_BOARDS = [
+    "plaid",
+    "notion",
+    "twilio",
+    "lyft",
+    "airbnb",
+    "doordash",
+    "square",
+    "snowflake",
+    "hashicorp",
+    "robinhood",
+]
+
+UA = "Mozilla/5.0 (OpenClaw Hunter Collector)"
+
+
+def board_list(env_name: str, default: list) -> list:
+    return [b.strip() for b in os.environ.get(env_name, ",".join(default)).split(",") if b.strip()]
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+def clean_html(text: str) -> str:
+    if not text:
+        return ""
+    text = re.sub(r"<[^>]+>", "", str(text))
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()[:240]
+
+
+class Deadline:
+    """Overall run budget shared by every fetch task."""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+def fetch_json(url: str, timeout: float = FETCH_TIMEOUT, slots: threading.BoundedSemaphore = None, deadline: Deadline = None):
+    if deadline is not None:
+        timeout = min(timeout, deadline.remaining())
+        if timeout <= 0:
+            raise DeadlineExceeded(url)
+    if slots is not None and not slots.acquire(timeout=timeout):
+        raise DeadlineExceeded(url)
+    try:
+        if deadline is not None:
+            timeout = min(timeout, deadline.remaining())
+            if timeout <= 0:
+                raise DeadlineExceeded(url)
+        req = Request(url, headers={"User-Agent": UA, "Accept": "application/json"})
+        with urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read())
+    finally:
+        if slots is not None:
+            slots.release()
+
+
+def fetch_json_with_agent_browser(url: str):
+    """Optional browser-based JSON fetch for bot-sensitive endpoints."""
+    try:
+        subprocess.run(["agent-browser", "close"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        opened = subprocess.run(["agent-browser", "open", url], capture_output=True, text=True, check=False)
+        if opened.returncode != 0:
+            return None
+        body = subprocess.run(["agent-browser", "get", "text", "body"], capture_output=True, text=True, check=False)
+        subprocess.run(["agent-browser", "close"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        if body.returncode != 0:
+            return None
+        return json.loads(body.stdout)
+    except Exception:
+        return None
+
+
+def parse_dt(value):
+    if value is None:
+        return None
+    s = str(value).strip()
+    if not s:
+        return None
+
+    if s.isdigit():
+        try:
+            ts = int(s)
+            if ts > 1_000_000_000_000:
+                ts = ts / 1000
+            if ts > 1_000_000_000:
+                return datetime.fromtimestamp(ts, tz=timezone.utc)
+        except Exception:
+            pass
+
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except Exception:
+        pass
+
+    try:
+        dt = parsedate_to_datetime(s)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except Exception:
+        return None
+
+
+def is_recent(posted_value, max_age_days=MAX_AGE_DAYS):
+    dt = parse_dt(posted_value)
+    if dt is None:
+        return True
+    age = datetime.now(timezone.utc) - dt
+    if age < timedelta(days=-2):
+        return False
+    return age <= timedelta(days=max_age_days)
+
+
+def normalize_job(job):
+    title = str(job.get("title") or "").strip()
+    url = str(job.get("url") or "").strip()
+    if not title or not url:
+        return None
+
+    tags = job.get("tags", [])
+    if not isinstance(tags, list):
+        tags = []
+
+    return {
+        "title": title,
+        "company": str(job.get("company") or "").strip(),
+        "location": str(job.get("location") or "Remote").strip(),
+        "salary": str(job.get("salary") or ""),
+        "url": url,
+        "posted_at": str(job.get("posted_at") or ""),
+        "tags": tags[:10],
+        # Adapters already ran clean_html; cached jobs must not pay for it again.
+        "description_snippet": str(job.get("description_snippet") or "")[:240],
+        "source": str(job.get("source") or "Unknown"),
+    }
+
+
+TARGET_TITLES = [
+    "software engineer", "software developer", "backend", "front end", "frontend", "full stack", "fullstack",
+    "data engineer", "data analyst", "data scientist", "analytics engineer", "ml engineer", "machine learning",
+    "ai engineer", "devops", "site reliability", "sre", "cloud engineer", "platform engineer", "python",
+    "node", "react", "typescript", "java", "golang", "rust", "security engineer", "devsecops",
+]
+
+EXCLUDE_TITLES = [
+    "account director", "account manager", "office assistant", "recruiter", "sales", "customer support",
+    "talent acquisition", "copywriter", "social media", "nurse", "pharmacist", "teacher",
+    "legal", "counsel", "attorney", "compliance", "hr ", "human resources", "marketing",
+]
+
+
+def matches_target(job):
+    title = f"{job.get('title','')}".lower()
+    tags_text = " ".join(job.get('tags', [])).lower()
+    text = f"{title} {tags_text}"
+    if any(x in text for x in EXCLUDE_TITLES):
+        return False
+    # Prefer explicit role-title matching
+    if any(x in title for x in TARGET_TITLES):
+        return True
+    # Allow tech-tag fallback for sparse titles
+    tech_tag_fallback = ["python", "backend", "frontend", "full-stack", "devops", "machine-learning", "data-engineering"]
+    return any(x in tags_text for x in tech_tag_fallback)
+
+
+# -----------------------------------------------------------------------------
+# Incremental state
+# -----------------------------------------------------------------------------
+STATE_VERSION = 1
+
+
+def state_path() -> str:
+    return os.environ.get("HUNTER_STATE_FILE", os.path.join(os.getcwd(), ".hunter_state.json"))
+
+
+def load_state(path: str) -> dict:
+    try:
+        with open(path) as f:
+            state = json.load(f)
+        if state.get("version") == STATE_VERSION and isinstance(state.get("boards"), dict):
+            return state
+    except (OSError, ValueError):
+        pass
+    return {"version": STATE_VERSION, "boards": {}}
+
+
+def save_state(path: str, state: dict):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def fingerprint(raw) -> int:
+    """Cheap checksum of a posting's raw fields, taken before any cleaning."""
+    return zlib.crc32("\x1f".join("" if v is None else str(v) for v in raw).encode("utf-8", "replace"))
+
+
+class BoardState:
+    """Per-board slice of the state file: job fingerprints + updated_at high-water mark.
+
+    `process()` runs a board's raw postings through the adapter; postings whose
+    fingerprint matches the previous run reuse the cached cleaned job (and its
+    target-match verdict) instead of re-running clean_html / matches_target.
+    When the board has a high-water mark, none of its postings moved past it
+    and its posting set is unchanged, the whole board is replayed from state
+    without fingerprinting anything.
+    """
+
+    def __init__(self, name: str, prior: dict = None):
+        self.name = name
+        self.prior = prior or {}
+        self.entries = {}
+        self.emitted = []
+        self.high_water = self.prior.get("high_water")
+        self.keyset = None
+        self.target_only = None
+        self.changed_urls = set()
+        self.counts = {"new": 0, "changed": 0, "unchanged": 0}
+        self.removed = []
+        self.replayed = False
+
+    def process(self, items, key, build, raw, stamp=None, target_only=False, limit=None):
+        prior_entries = self.prior.get("jobs", {})
+        keys = [key(j) for j in items]
+        self.keyset = zlib.crc32("\n".join(sorted(keys)).encode("utf-8", "replace"))
+        self.target_only = target_only
+        seen = set(keys)
+        self.removed = [prior_entries[k]["job"] for k in self.prior.get("emitted", [])
+                        if k not in seen and k in prior_entries]
+
+        stamps = [parse_dt(stamp(j)) for j in items] if stamp else []
+        board_max = max((d for d in stamps if d), default=None)
+        prior_max = parse_dt(self.high_water)
+        if board_max is not None:
+            self.high_water = max(board_max, prior_max).isoformat() if prior_max else board_max.isoformat()
+
+        if (stamp and prior_max and board_max and board_max <= prior_max
+                and self.prior.get("keyset") == self.keyset
+                and self.prior.get("target_only") == target_only):
+            self.replayed = True
+            self.entries = {k: e for k, e in prior_entries.items() if k in seen}
+            self.emitted = [k for k in self.prior.get("emitted", []) if k in self.entries]
+            self.counts["unchanged"] = len(self.emitted)
+            return [self.entries[k]["job"] for k in self.emitted]
+
+        out = []
+        for k, j in zip(keys, items):
+            if limit is not None and len(out) >= limit:
+                break
+            fp = fingerprint(raw(j))
+            prev = prior_entries.get(k)
+            if prev and prev.get("fp") == fp:
+                job, matched = prev["job"], prev.get("m")
+                self.counts["unchanged"] += 1
+            else:
+                job, matched = build(j), None
+                self.counts["changed" if prev else "new"] += 1
+                self.changed_urls.add(job.get("url", ""))
+            if target_only and matched is None:
+                matched = matches_target(job)
+            self.entries[k] = {"fp": fp, "job": job, "m": matched}
+            if target_only and not matched:
+                continue
+            out.append(job)
+            self.emitted.append(k)
+
+        # Postings past the per-board cap keep their cached entry for next run.
+        for k, e in prior_entries.items():
+            if k in seen and k not in self.entries:
+                self.entries[k] = e
+        return out
+
+    def dump(self) -> dict:
+        return {
+            "high_water": self.high_water,
+            "keyset": self.keyset,
+            "target_only": self.target_only,
+            "emitted": self.emitted,
+            "jobs": self.entries,
+        }
+
+
+# -----------------------------------------------------------------------------
+# Source adapters: describe how to key, fingerprint and build each posting
+# -----------------------------------------------------------------------------
+def parse_greenhouse(board, data, target_only, state):
+    def build(j):
+        metadata = j.get("metadata", {})
+        company_from_meta = metadata.get("company_name") if isinstance(metadata, dict) else None
+        dept_names = [d.get("name", "") for d in j.get("departments", []) if isinstance(d, dict) and d.get("name")]
+        return {
+            "title": j.get("title", ""),
+            "company": company_from_meta or board.replace("-", " ").title(),
+            "location": (j.get("location") or {}).get("name", "") or "Unknown",
+            "salary": "",
+            "url": j.get("absolute_url", ""),
+            "posted_at": j.get("updated_at") or j.get("updatedAt") or j.get("created_at") or "",
+            "tags": (dept_names + [board])[:6],
+            "description_snippet": clean_html(j.get("content", "")),
+            "source": f"Greenhouse:{board}",
+        }
+
+    return state.process(
+        data.get("jobs", []),
+        key=lambda j: str(j.get("id") or j.get("absolute_url", "")),
+        build=build,
+        raw=lambda j: (j.get("updated_at") or j.get("updatedAt"), j.get("title"), (j.get("location") or {}).get("name"),
+                       j.get("absolute_url"), j.get("departments"), j.get("metadata"), j.get("content")),
+        stamp=lambda j: j.get("updated_at") or j.get("updatedAt"),
+        target_only=target_only,
+        limit=PER_GREENHOUSE_BOARD_LIMIT,
+    )
+
+
+def parse_lever(board, data, target_only, state):
+    if not isinstance(data, list):
+        return []
+
+    def build(j):
+        categories = j.get("categories", {})
+        posted = j.get("createdAt")
+        return {
+            "title": j.get("text", ""),
+            "company": board.replace("-", " ").title(),
+            "location": categories.get("location", "Unknown") or categories.get("team", "Unknown"),
+            "salary": categories.get("salary", ""),
+            "url": j.get("applyUrl", ""),
+            "posted_at": str(posted) if posted else "",
+            "tags": [categories.get("team", ""), categories.get("location", "")][:5],
+            "description_snippet": clean_html(j.get("description", "")),
+            "source": f"Lever:{board}",
+        }
+
+    return state.process(
+        data[:PER_GREENHOUSE_BOARD_LIMIT],
+        key=lambda j: str(j.get("id") or j.get("applyUrl", "")),
+        build=build,
+        raw=lambda j: (j.get("text"), j.get("applyUrl"), j.get("createdAt"), j.get("categories"), j.get("description")),
+        target_only=target_only,
+    )
+
+
+def parse_remotive(_name, data, target_only, state):
+    def build(j):
+        return {
+            "title": j.get("title", ""),
+            "company": j.get("company_name", ""),
+            "location": j.get("candidate_required_location", "Remote"),
+            "salary": j.get("salary", ""),
+            "url": j.get("url", ""),
+            "posted_at": j.get("publication_date", ""),
+            "tags": j.get("tags", [])[:6] if isinstance(j.get("tags", []), list) else [],
+            "description_snippet": clean_html(j.get("description", "")),
+            "source": "Remotive",
+        }
+
+    return state.process(
+        data.get("jobs", [])[:PER_SOURCE_LIMIT],
+        key=lambda j: str(j.get("id") or j.get("url", "")),
+        build=build,
+        raw=lambda j: (j.get("title"), j.get("company_name"), j.get("candidate_required_location"), j.get("salary"),
+                       j.get("url"), j.get("publication_date"), j.get("tags"), j.get("description")),
+        target_only=target_only,
+    )
+
+
+def parse_remoteok(_name, data, target_only, state):
+    items = []
+    if isinstance(data, list):
+        items = [j for j in data if isinstance(j, dict) and "position" in j][:PER_SOURCE_LIMIT]
+
+    def build(j):
+        tags = j.get("tags", [])
+        if not isinstance(tags, list):
+            tags = []
+        return {
+            "title": j.get("position", ""),
+            "company": j.get("company", ""),
+            "location": j.get("location", "Remote") or "Remote",
+            "salary": "",
+            "url": j.get("url", ""),
+            "posted_at": j.get("date", ""),
+            "tags": tags[:6],
+            "description_snippet": clean_html(j.get("description", "")),
+            "source": "RemoteOK",
+        }
+
+    return state.process(
+        items,
+        key=lambda j: str(j.get("id") or j.get("url", "")),
+        build=build,
+        raw=lambda j: (j.get("position"), j.get("company"), j.get("location"), j.get("url"), j.get("date"),
+                       j.get("tags"), j.get("description")),
+        target_only=target_only,
+    )
+
+
+def parse_arbeitnow(_name, data, target_only, state):
+    def build(j):
+        tags = j.get("tags", [])
+        if not isinstance(tags, list):
+            tags = []
+        return {
+            "title": j.get("title", ""),
+            "company": j.get("company_name", ""),
+            "location": "Remote" if j.get("remote") else j.get("location", ""),
+            "salary": "",
+            "url": j.get("url", ""),
+            "posted_at": str(j.get("created_at", "")),
+            "tags": tags[:6],
+            "description_snippet": clean_html(j.get("description", "")),
+            "source": "Arbeitnow",
+        }
+
+    return state.process(
+        data.get("data", [])[:PER_SOURCE_LIMIT],
+        key=lambda j: str(j.get("slug") or j.get("url", "")),
+        build=build,
+        raw=lambda j: (j.get("title"), j.get("company_name"), j.get("remote"), j.get("location"), j.get("url"),
+                       j.get("created_at"), j.get("tags"), j.get("description")),
+        target_only=target_only,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Fetch plan + concurrent runner
+# -----------------------------------------------------------------------------
+def build_tasks():
+    """(name, url, parser) per independent fetch, in output order."""
+    tasks = []
+    # Tier 1: first-party ATS feeds (preferred)
+    for board in board_list("GREENHOUSE_BOARDS", DEFAULT_GREENHOUSE_BOARDS):
+        tasks.append((f"Greenhouse:{board}", f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs?content=true",
+                      lambda data, tgt, st, b=board: parse_greenhouse(b, data, tgt, st)))
+    for board in board_list("LEVER_BOARDS", DEFAULT_LEVER_BOARDS):
+        tasks.append((f"Lever:{board}", f"https://api.lever.co/v0/postings/{board}",
+                      lambda data, tgt, st, b=board: parse_lever(b, data, tgt, st)))
+
+    # Tier 2: aggregator feeds (optional fallback)
+    if USE_AGGREGATOR_SOURCES:
+        for cat in ["software-dev", "data", "devops-sysadmin", "cyber-security"]:
+            tasks.append((f"Remotive:{cat}", f"https://remotive.com/api/remote-jobs?category={cat}&limit={PER_SOURCE_LIMIT}",
+                          lambda data, tgt, st, c=cat: parse_remotive(c, data, tgt, st)))
+        tasks.append(("RemoteOK", "https://remoteok.com/api", lambda data, tgt, st: parse_remoteok("RemoteOK", data, tgt, st)))
+        tasks.append(("Arbeitnow", "https://www.arbeitnow.com/api/job-board-api",
+                      lambda data, tgt, st: parse_arbeitnow("Arbeitnow", data, tgt, st)))
+    return tasks
+
+
+def run_task(name, url, parser, target_only, board_state, slots, deadline):
+    started = time.monotonic()
+    report = {"name": name, "host": urlparse(url).netloc, "status": "ok", "jobs": 0}
+    jobs = []
+    try:
+        data = None
+        if name == "RemoteOK" and USE_AGENT_BROWSER_REMOTEOK:
+            data = fetch_json_with_agent_browser(url)
+        if data is None:
+            data = fetch_json(url, slots=slots, deadline=deadline)
+        jobs = parser(data, target_only, board_state)
+        report["jobs"] = len(jobs)
+        if board_state.replayed:
+            report["replayed"] = True
+    except DeadlineExceeded:
+        report["status"] = "deadline"
+    except Exception as exc:
+        report["status"] = "error"
+        report["error"] = str(exc)[:180]
+    report["seconds"] = round(time.monotonic() - started, 3)
+    return jobs, report
+
+
+def collect_all(target_only, state):
+    """Fetch every task concurrently. Returns (candidates, fetch_report, board_states).
+
+    Each host gets its own pool (HOST_LIMITS, else PER_HOST_LIMIT threads) so
+    a slow API can't starve the others; a shared semaphore caps total
+    in-flight requests at MAX_WORKERS. Tasks still running at the deadline
+    are reported as "deadline" and abandoned; the __main__ block exits
+    without joining them.
+    """
+    tasks = build_tasks()
+    deadline = Deadline(RUN_DEADLINE_SECONDS)
+    slots = threading.BoundedSemaphore(max(1, MAX_WORKERS))
+
+    pools = {}
+    futures = []
+    board_states = {}
+    for name, url, parser in tasks:
+        board_states[name] = BoardState(name, state["boards"].get(name))
+        host = urlparse(url).netloc
+        pool = pools.get(host)
+        if pool is None:
+            limit = HOST_LIMITS.get(host, PER_HOST_LIMIT)
+            pool = pools[host] = ThreadPoolExecutor(max_workers=max(1, limit), thread_name_prefix=f"fetch-{host}")
+        futures.append(pool.submit(run_task, name, url, parser, target_only, board_states[name],
+                                   slots, deadline))
+    wait(futures, timeout=deadline.remaining())
+    # Don't block on stragglers past the deadline (see __main__ for process exit).
+    for pool in pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    collected, report = [], []
+    for (name, url, _parser), fut in zip(tasks, futures):
+        if fut.done() and not fut.cancelled():
+            jobs, task_report = fut.result()
+        else:
+            jobs = []
+            task_report = {"name": name, "host": urlparse(url).netloc, "status": "deadline",
+                           "jobs": 0, "seconds": round(RUN_DEADLINE_SECONDS, 3)}
+        collected.extend(jobs)
+        report.append(task_report)
+    return collected, report, board_states
+
+
+def print_report(report, elapsed):
+    slowest = sorted(report, key=lambda r: -r["seconds"])
+    print(f"[collector] {len(report)} fetches in {elapsed:.1f}s "
+          f"(sum of fetch times {sum(r['seconds'] for r in report):.1f}s)", file=sys.stderr)
+    for r in slowest:
+        extra = f" {r['error']}" if r.get("error") else ""
+        print(f"[collector] {r['seconds']:7.2f}s {r['status']:<8} {r['jobs']:>4} jobs  {r['name']}{extra}", file=sys.stderr)
+
+
+# -----------------------------------------------------------------------------
+# Collect + normalize + filter
+# -----------------------------------------------------------------------------
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    target_only = False
+    incremental = False
+    for arg in argv:
+        if arg == "--target-only":
+            target_only = True
+        elif arg == "--incremental":
+            incremental = True
+        elif arg in ("--help", "-h"):
+            print("Usage: hunter_collector.py [--target-only] [--incremental]")
+            return 0
+
+    timestamp = datetime.now().astimezone().isoformat(timespec="seconds")
+    path = state_path()
+    state = load_state(path)
+    run_started = time.monotonic()
+    collected, fetch_report, board_states = collect_all(target_only, state)
+    elapsed = time.monotonic() - run_started
+
+    normalized = []
+    for j in collected:
+        nj = normalize_job(j)
+        if nj:
+            normalized.append(nj)
+
+    # Deduplicate (url first, then title+company)
+    seen = set()
+    unique = []
+    for j in normalized:
+        key = (
+            (j.get("url") or "").strip().lower(),
+            (j.get("title") or "").strip().lower(),
+            (j.get("company") or "").strip().lower(),
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(j)
+
+    # Freshness
+    unique = [j for j in unique if is_recent(j.get("posted_at"))]
+
+    # Targeted role filter already ran per posting in BoardState.process
+    # (cached for unchanged postings), so there's nothing left to drop here.
+
+    # Keep deterministic order by newest posted date where possible
+    unique.sort(key=lambda j: parse_dt(j.get("posted_at")) or datetime(1970, 1, 1, tzinfo=timezone.utc), reverse=True)
+
+    # Persist state for boards that fetched cleanly; failed / timed-out boards
+    # keep last run's entries so they don't show up as mass removals.
+    ok_boards = {r["name"] for r in fetch_report if r["status"] == "ok"}
+    changed_urls = set()
+    removed = []
+    counts = {"new": 0, "changed": 0, "unchanged": 0}
+    for name, bs in board_states.items():
+        if name not in ok_boards:
+            continue
+        state["boards"][name] = bs.dump()
+        changed_urls |= bs.changed_urls
+        removed.extend(bs.removed)
+        for k, v in bs.counts.items():
+            counts[k] += v
+    state["fetched_at"] = timestamp
+    try:
+        save_state(path, state)
+    except OSError as exc:
+        print(f"[collector] could not write state {path}: {exc}", file=sys.stderr)
+
+    live_urls = {j["url"] for j in unique}
+    removed = [
+        {"url": j.get("url", ""), "title": j.get("title", ""), "company": j.get("company", ""), "source": j.get("source", "")}
+        for j in removed if j.get("url") not in live_urls
+    ]
+    counts["removed"] = len(removed)
+    counts["replayed_boards"] = sum(1 for r in fetch_report if r.get("replayed"))
+
+    if incremental:
+        unique = [j for j in unique if j["url"] in changed_urls]
+
+    source_counts = {}
+    for j in unique:
+        src = j.get("source", "Unknown")
+        source_counts[src] = source_counts.get(src, 0) + 1
+
+    print_report(fetch_report, elapsed)
+    print(f"[collector] state: {counts['new']} new, {counts['changed']} changed, {counts['unchanged']} unchanged, "
+          f"{counts['removed']} removed, {counts['replayed_boards']} boards replayed ({path})", file=sys.stderr)
+
+    output = {
+        "fetched_at": timestamp,
+        "sources": sorted(list(source_counts.keys())),
+        "source_counts": source_counts,
+        "fresh_window_days": MAX_AGE_DAYS,
+        "aggregator_sources_enabled": USE_AGGREGATOR_SOURCES,
+        "incremental": incremental,
+        "total": len(unique),
+        "changes": counts,
+        "run_seconds": round(elapsed, 3),
+        "fetch_report": fetch_report,
+        "jobs": unique,
+        "removed": removed,
+    }
+
+    print(json.dumps(output, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    code = main()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # Pool threads are joined at interpreter exit, so a fetch stuck in a slow
+    # socket read past the deadline would hold the process open; output is
+    # already written, so leave without waiting for them.
+    os._exit(code)
@@ -3,20 +3,27 @@
 push-jobs-snapshot.py
 Push collected Hunter jobs JSON to dashboard /api/update.py as jobs_snapshot.
 
+Bodies are gzip-compressed. Snapshots larger than DASHBOARD_PUSH_BATCH_SIZE
+jobs are split into batches that share one snapshot_id; the dashboard stages
+them and commits the snapshot atomically when the last batch arrives.
+
 Usage:
   python3 push-jobs-snapshot.py /tmp/hunter_target_jobs.json
 """
 
+import gzip
 import json
 import os
 import sys
 import urllib.request
+import uuid
 from urllib.parse import urlparse
 from datetime import datetime, timezone
 
 DASHBOARD_URL = os.getenv("DASHBOARD_URL", "http://45.55.191.125")
 TOKEN = os.getenv("DASHBOARD_UPDATE_TOKEN", "")
-MAX_JOBS = 500
+MAX_JOBS = 1000  # server-side JOBS_SNAPSHOT_MAX_ITEMS
+BATCH_SIZE = max(1, int(os.getenv("DASHBOARD_PUSH_BATCH_SIZE", "250")))
 
 
 def safe_external_url(value) -> str:
@@ -53,6 +60,23 @@ def normalize(job: dict) -> dict:
     }
 
 
+def post_json(payload: dict) -> dict:
+    body = gzip.compress(json.dumps(payload).encode("utf-8"))
+    req = urllib.request.Request(
+        f"{DASHBOARD_URL}/api/update.py",
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "Authorization": f"Bearer {TOKEN}",
+        },
+        method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        resp_body = resp.read().decode("utf-8", errors="ignore")
+    return json.loads(resp_body)
+
+
 def main() -> int:
     if len(sys.argv) < 2:
         print("Usage: push-jobs-snapshot.py <jobs_json_path>", file=sys.stderr)
@@ -69,42 +93,44 @@ def main() -> int:
     fetched_at = data.get("fetched_at") if isinstance(data, dict) else None
     sources = data.get("sources", []) if isinstance(data, dict) else []
 
-    payload = {
-        "update_source": "hunter",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "kpi_updates": {
-            "Hunter Targeted Jobs": str(len(jobs)),
-            "Hunter Last Jobs Sync": fetched_at or datetime.now(timezone.utc).isoformat(),
-        },
-        "jobs_snapshot": {
-            "fetched_at": fetched_at,
-            "sources": sources if isinstance(sources, list) else [],
-            "jobs": jobs,
-        },
-    }
-
-    body = json.dumps(payload).encode("utf-8")
     if not TOKEN:
         print("DASHBOARD_UPDATE_TOKEN is required; refusing to use a fallback token.", file=sys.stderr)
         return 2
 
-    req = urllib.request.Request(
-        f"{DASHBOARD_URL}/api/update.py",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {TOKEN}",
-        },
-        method="POST",
-    )
-
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        resp_body = resp.read().decode("utf-8", errors="ignore")
+    batches = [jobs[i:i + BATCH_SIZE] for i in range(0, len(jobs), BATCH_SIZE)] or [[]]
+    snapshot_id = uuid.uuid4().hex
+
+    out = {}
+    for index, batch in enumerate(batches):
+        payload = {
+            "update_source": "hunter",
+            "jobs_snapshot": {
+                "snapshot_id": snapshot_id,
+                "batch_index": index,
+                "batch_count": len(batches),
+                "fetched_at": fetched_at,
+                "sources": sources if isinstance(sources, list) else [],
+                "jobs": batch,
+            },
+        }
+        if index == len(batches) - 1:
+            # The batch that completes the snapshot carries the rest of the update.
+            payload.update({
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "kpi_updates": {
+                    "Hunter Targeted Jobs": str(len(jobs)),
+                    "Hunter Last Jobs Sync": fetched_at or datetime.now(timezone.utc).isoformat(),
+                },
+            })
+
+        out = post_json(payload)
+        if not out.get("ok"):
+            print(json.dumps(out))
+            return 1
+        if out.get("staged"):
+            print(f"staged batch {index + 1}/{len(batches)} of snapshot {snapshot_id}", file=sys.stderr)
 
-    out = json.loads(resp_body)
     print(json.dumps(out))
-    if not out.get("ok"):
-        return 1
     if int(out.get("jobs_count", 0)) <= 0 and len(jobs) > 0:
         # Server did not accept jobs correctly
         return 3
@@ -68,7 +68,8 @@ Group=www-data
 WorkingDirectory=$APP_DIR
 Environment="PATH=$VENV_DIR/bin:/usr/bin:/bin"
 Environment="DASHBOARD_UPDATE_TOKEN=$TOKEN"
-ExecStart=$VENV_DIR/bin/gunicorn -w 2 -b 127.0.0.1:8000 --timeout 120 --access-logfile /var/log/dashboard-access.log --error-logfile /var/log/dashboard-error.log app:app
+Environment="JOBS_PAGES_ACCEL_PREFIX=/_pages/"
+ExecStart=$VENV_DIR/bin/gunicorn -c $APP_DIR/gunicorn.conf.py -w 2 -b 127.0.0.1:8000 --timeout 120 --access-logfile /var/log/dashboard-access.log --error-logfile /var/log/dashboard-error.log app:app
 Restart=always
 RestartSec=5
 
@@ -106,6 +107,18 @@ server {
         proxy_read_timeout 120s;
     }
     
+    # Pre-rendered /api/jobs.py pages, handed over via X-Accel-Redirect
+    location /_pages/ {
+        internal;
+        alias /opt/dashboard/app/data/pages/;
+        gzip_static on;
+        default_type application/json;
+        add_header Access-Control-Allow-Origin "*" always;
+        add_header Vary "Accept-Encoding" always;
+        add_header X-Frame-Options "SAMEORIGIN" always;
+        add_header X-Content-Type-Options "nosniff" always;
+    }
+
     location /css/ {
         alias /opt/dashboard/app/static/css/;
         expires 1h;
@@ -10,22 +10,71 @@ const API = (() => {
     const params = new URLSearchParams();
     if (query) params.set('query', query);
     if (type && type !== 'all') params.set('type', type);
+    if (source && source !== 'all') params.set('source', source);
     params.set('page', page);
+    params.set('format', 'columnar');
     if (force) params.set('force', '1');
 
     const url = `${CGI_BIN}/jobs.py?${params.toString()}`;
     const resp = await fetch(url);
+    if (force && (resp.status === 202 || resp.status === 429)) {
+      // Nothing cached yet: a plain load waits for the in-flight refresh.
+      return fetchJobs({ query, type, source, page, force: false });
+    }
     if (!resp.ok) throw new Error(`Jobs API error: ${resp.status}`);
     const data = await resp.json();
+    if (data.format === 'columnar') data.jobs = decodeColumnar(data);
+    return data;
+  }
 
-    // Client-side source filtering (API doesn't support it natively)
-    if (source && source !== 'all') {
-      data.jobs = data.jobs.filter(j =>
-        j.source && j.source.toLowerCase().includes(source.toLowerCase())
-      );
+  /* Columnar page → array of job objects (without snippets). */
+  function decodeColumnar(data) {
+    const cols = data.columns || {};
+    const strings = data.strings || [];
+    const categorical = new Set(data.categorical || []);
+    const fields = data.fields || Object.keys(cols);
+    const n = (cols[fields[0]] || []).length;
+    const jobs = new Array(n);
+    for (let i = 0; i < n; i++) jobs[i] = {};
+    for (const field of fields) {
+      const col = cols[field] || [];
+      const isCat = categorical.has(field);
+      for (let i = 0; i < n; i++) {
+        const v = col[i];
+        jobs[i][field] = !isCat ? v
+          : Array.isArray(v) ? v.map(k => strings[k])
+          : strings[v];
+      }
     }
+    return jobs;
+  }
 
-    return data;
+  async function fetchJobDetails(ids) {
+    if (!ids || !ids.length) return {};
+    const url = `${CGI_BIN}/job.py?id=${encodeURIComponent(ids.join(','))}`;
+    const resp = await fetch(url);
+    if (!resp.ok) throw new Error(`Job detail API error: ${resp.status}`);
+    const data = await resp.json();
+    return data.jobs || {};
+  }
+
+  /* Fill the lazy snippet slots rendered by renderJobCard in one request. */
+  async function hydrateSnippets(container, jobs) {
+    if (!container) return;
+    const ids = (jobs || []).filter(j => j.id && j.snippet === undefined).map(j => j.id);
+    if (!ids.length) return;
+    try {
+      const details = await fetchJobDetails(ids);
+      container.querySelectorAll('[data-snippet-for]').forEach(el => {
+        const detail = details[el.dataset.snippetFor];
+        if (detail && detail.snippet) {
+          el.textContent = `${detail.snippet.substring(0, 180)}…`;
+          el.hidden = false;
+        }
+      });
+    } catch {
+      // Cards stay without snippets
+    }
   }
 
   /* ── NEWS ─────────────────────────────────────────────────── */
@@ -33,10 +82,50 @@ const API = (() => {
     const params = force ? '?force=1' : '';
     const url = `${CGI_BIN}/news.py${params}`;
     const resp = await fetch(url);
+    if (force && (resp.status === 202 || resp.status === 429)) {
+      // Nothing cached yet: a plain load waits for the in-flight refresh.
+      return fetchNews(false);
+    }
     if (!resp.ok) throw new Error(`News API error: ${resp.status}`);
     return resp.json();
   }
 
+  /* ── TRENDS ───────────────────────────────────────────────── */
+  async function fetchTrends({ dimension = 'tags', granularity = 'daily', limit = 8 } = {}) {
+    const params = new URLSearchParams({ dimension, granularity, limit });
+    const resp = await fetch(`${CGI_BIN}/trends.py?${params.toString()}`);
+    if (!resp.ok) throw new Error(`Trends API error: ${resp.status}`);
+    return resp.json();
+  }
+
+  /* ── STATS ────────────────────────────────────────────────── */
+  async function fetchStats() {
+    const resp = await fetch(`${CGI_BIN}/stats.py`);
+    if (!resp.ok) throw new Error(`Stats API error: ${resp.status}`);
+    return resp.json();
+  }
+
+  /* ── CHANGE NOTICES (SSE) ─────────────────────────────────── */
+  /* Calls onChange({version, changed: [...sections], etags}) whenever the
+     server reports new data. Returns null if EventSource isn't available. */
+  function subscribeChanges(onChange, onUnavailable) {
+    if (!window.EventSource) return null;
+    const source = new EventSource(`${CGI_BIN}/events.py`);
+    source.addEventListener('error', () => {
+      // A non-200 answer (503 when the server is at its stream cap) closes the
+      // EventSource for good; normal stream ends leave it reconnecting.
+      if (source.readyState === EventSource.CLOSED && onUnavailable) onUnavailable();
+    });
+    source.addEventListener('change', (e) => {
+      try {
+        onChange(JSON.parse(e.data));
+      } catch {
+        // Ignore malformed notices
+      }
+    });
+    return source;
+  }
+
   /* ── TIME HELPERS ─────────────────────────────────────────── */
   function relativeTime(dateStr) {
     if (!dateStr) return 'Recently';
@@ -119,6 +208,9 @@ const API = (() => {
     const salary = job.salary ? `<span class="job-salary">${escHtml(job.salary)}</span>` : '';
     const time   = relativeTime(job.posted);
     const snippet = job.snippet ? escHtml(job.snippet.substring(0, 180)) : '';
+    const lazySnippet = (job.snippet === undefined && job.id)
+      ? `<p class="job-snippet" data-snippet-for="${escHtml(job.id)}" hidden></p>`
+      : '';
 
     return `
       <div class="job-card">
@@ -131,7 +223,7 @@ const API = (() => {
             ${job.location ? `<span class="job-location">📍 ${escHtml(job.location)}</span>` : ''}
             ${salary}
           </div>
-          ${snippet ? `<p class="job-snippet">${snippet}…</p>` : ''}
+          ${snippet ? `<p class="job-snippet">${snippet}…</p>` : lazySnippet}
           <div class="tags-row">
             ${typeBadge}
             <span class="badge ${srcClass}">${escHtml(job.source || '')}</span>
@@ -239,7 +331,13 @@ const API = (() => {
 
   return {
     fetchJobs,
+    decodeColumnar,
+    fetchJobDetails,
+    hydrateSnippets,
     fetchNews,
+    fetchTrends,
+    fetchStats,
+    subscribeChanges,
     relativeTime,
     formatDate,
     categorizeNews,
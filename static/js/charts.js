@@ -381,6 +381,102 @@ const Charts = (() => {
     });
   }
 
+  /* ── 6. LIVE DEMAND TRENDS (from /api/trends.py rollups) ─── */
+  function initDemandChart(canvasId, trends) {
+    const ctx = document.getElementById(canvasId);
+    if (!ctx || !trends) return;
+
+    const palette = [CYAN, MAGENTA, LIME, AMBER, PURPLE, '#FF6B35', '#4DD0E1', '#F06292'];
+    const labels = (trends.buckets || []).map(b =>
+      trends.granularity === 'hourly' ? b.slice(5, 16).replace('T', ' ') : b.slice(5)
+    );
+    const datasets = Object.entries(trends.series || {}).map(([name, data], i) => ({
+      label: name,
+      data,
+      borderColor: palette[i % palette.length],
+      backgroundColor: 'transparent',
+      pointRadius: 2,
+      pointHoverRadius: 5,
+      borderWidth: 1.8,
+      tension: 0.35,
+    }));
+
+    return new Chart(ctx, {
+      type: 'line',
+      data: { labels, datasets },
+      options: {
+        responsive: true,
+        maintainAspectRatio: true,
+        interaction: { mode: 'index', intersect: false },
+        plugins: {
+          legend: {
+            display: true,
+            position: 'top',
+            labels: {
+              color: '#5A6480',
+              font: { size: 11 },
+              boxWidth: 12,
+              usePointStyle: true,
+              padding: 16,
+            },
+          },
+          tooltip: {
+            ...tooltipOpts(),
+            callbacks: { label: (c) => ` ${c.dataset.label}: ${c.parsed.y} jobs` },
+          },
+        },
+        scales: {
+          ...baseScales(),
+          y: { ...baseScales().y, beginAtZero: true },
+        },
+      },
+    });
+  }
+
+  /* ── 7. LIVE SALARY DISTRIBUTION (from /api/stats.py) ───── */
+  function initSalaryDistributionChart(canvasId, histogram) {
+    const ctx = document.getElementById(canvasId);
+    if (!ctx || !histogram || !histogram.counts) return;
+
+    // Buckets are in one currency only; other currencies are not converted.
+    const edges = histogram.edges || [];
+    const fmt = v => `${Math.round(v / 1000)}K`;
+    const labels = edges.map((e, i) => (i + 1 < edges.length ? `${fmt(e)}–${fmt(edges[i + 1])}` : `${fmt(e)}+`));
+    const others = Object.values(histogram.other_currencies || {}).reduce((a, b) => a + b, 0);
+    const datasets = [{
+      label: others ? `${histogram.currency} (${others} in other currencies not shown)` : histogram.currency,
+      data: histogram.counts,
+      backgroundColor: CYAN + 'B3',
+      borderColor: CYAN,
+      borderWidth: 1,
+      borderRadius: 3,
+    }];
+
+    return new Chart(ctx, {
+      type: 'bar',
+      data: { labels, datasets },
+      options: {
+        responsive: true,
+        maintainAspectRatio: true,
+        plugins: {
+          legend: {
+            display: true,
+            position: 'top',
+            labels: { color: '#5A6480', font: { size: 11 }, boxWidth: 12, padding: 16 },
+          },
+          tooltip: {
+            ...tooltipOpts(),
+            callbacks: { label: (c) => ` ${histogram.currency}: ${c.parsed.y} jobs` },
+          },
+        },
+        scales: {
+          ...baseScales(),
+          y: { ...baseScales().y, beginAtZero: true },
+        },
+      },
+    });
+  }
+
   /* ── DESTROY & REINIT GUARD ──────────────────────────────── */
   const registry = {};
 
@@ -400,5 +496,7 @@ const Charts = (() => {
     initSalaryRolesChart: (id) => init(id, initSalaryRolesChart),
     initLayoffsChart:    (id) => init(id, initLayoffsChart),
     initBLSChart:        (id) => init(id, initBLSChart),
+    initDemandChart:     (id, trends) => init(id, (cid) => initDemandChart(cid, trends)),
+    initSalaryDistributionChart: (id, histogram) => init(id, (cid) => initSalaryDistributionChart(cid, histogram)),
   };
 })();